@@ -8,6 +8,10 @@ This program implements a comprehensive Binary Search Tree with various operatio
 and visualization capabilities. No built-in libraries are used for core BST operations.
 '''
 
+import gc
+import math
+import numbers
+from array import array
 from typing import List, Optional, Any, Tuple # For code documentation and type checking
 
 class BSTNode:
@@ -15,6 +19,8 @@ class BSTNode:
     Node class for Binary Search Tree
     Each node contains data and pointers to left and right children
     '''
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data: Any):
         self.data = data
         self.left: Optional['BSTNode'] = None
@@ -23,16 +29,141 @@ class BSTNode:
     def __str__(self):
         return str(self.data)
 
+class NodePool:
+    '''
+    Free-list allocator for BSTNode objects
+    Deleted nodes are reset and kept on a free list so later inserts reuse them
+    instead of allocating, which cuts allocator and GC pressure under insert/delete churn
+    '''
+    def __init__(self, max_free: int = 1 << 16):
+        self.free_list: List[BSTNode] = []
+        self.max_free = max_free   # Cap on idle nodes kept alive
+        self.allocations = 0       # Fresh BSTNode objects created
+        self.reuses = 0            # Nodes handed out from the free list
+        self.releases = 0          # Nodes returned to the pool
+
+    def acquire(self, data: Any) -> BSTNode:
+        # Hand out a node holding data, reusing a free one when possible
+        if self.free_list:
+            node = self.free_list.pop()
+            node.data = data
+            self.reuses += 1
+            return node
+        self.allocations += 1
+        return BSTNode(data)
+
+    def release(self, node: BSTNode):
+        # Return a detached node to the free list (dropped once the list is full)
+        self.releases += 1
+        if len(self.free_list) < self.max_free:
+            node.data = None
+            node.left = None
+            node.right = None
+            self.free_list.append(node)
+
+    def preallocate(self, count: int):
+        # Fill the free list up front so steady-state churn never allocates
+        for _ in range(min(count, self.max_free - len(self.free_list))):
+            self.allocations += 1
+            self.free_list.append(BSTNode(None))
+
+    @staticmethod
+    def freeze_long_lived():
+        '''
+        Move every object alive now into the GC's permanent generation
+        Long-lived tree nodes are then skipped by future collections
+        '''
+        gc.collect()
+        gc.freeze()
+
+    @staticmethod
+    def unfreeze():
+        # Put frozen objects back under normal GC tracking
+        gc.unfreeze()
+
+    def get_statistics(self, operation_count: int = 0) -> dict:
+        # Allocation counters, including allocations per tree operation
+        return {
+            "pool_allocations": self.allocations,
+            "pool_reuses": self.reuses,
+            "pool_releases": self.releases,
+            "pool_free": len(self.free_list),
+            "allocations_per_op": self.allocations / operation_count if operation_count else 0.0,
+        }
+
+class BloomFilter:
+    '''
+    Probabilistic membership filter placed in front of the BST
+    A "not present" answer is always correct, a "maybe present" answer can be a false positive
+    Bit array size and hash count are derived from the expected items and target false-positive rate
+    '''
+    def __init__(self, expected_items: int = 1024, false_positive_rate: float = 0.01):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.capacity = max(1, expected_items)
+        self.false_positive_rate = false_positive_rate
+
+        # Optimal sizing: m = -n ln(p) / (ln 2)^2 bits, k = (m / n) ln 2 hashes
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, data: Any):
+        # Double hashing (h1 + i * h2) over a 64-bit mix of Python's hash
+        h = hash(data) & 0xFFFFFFFFFFFFFFFF
+        h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        h ^= h >> 31
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, data: Any):
+        # Set the k bits for data
+        for pos in self._positions(data):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def might_contain(self, data: Any) -> bool:
+        # False means definitely absent, True means possibly present
+        for pos in self._positions(data):
+            if not self.bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def is_saturated(self) -> bool:
+        # More items than the filter was sized for pushes the false-positive rate above target
+        return self.count > self.capacity
+
 class BinarySearchTree:
     '''
     Complete Binary Search Tree implementation with comprehensive operations
     Supports integers, floats, and strings with proper comparison
+    Optionally keeps a Bloom filter in front of search so definite misses skip the tree walk
+    Optionally draws nodes from a NodePool so insert/delete churn reuses node objects
     '''
 
-    def __init__(self):
+    def __init__(self, use_bloom_filter: bool = False, false_positive_rate: float = 0.01,
+                 expected_items: int = 1024, rebuild_ratio: float = 0.25,
+                 node_pool: Optional[NodePool] = None):
         self.root: Optional[BSTNode] = None
         self.size = 0
         self.operation_count = 0  # Track operations for analysis
+        self.node_pool = node_pool
+
+        # Optional Bloom filter front (deleted keys stay in the filter until the next rebuild)
+        self.bloom_filter: Optional[BloomFilter] = None
+        self.false_positive_rate = false_positive_rate
+        self.rebuild_ratio = rebuild_ratio
+        self.deletes_since_rebuild = 0
+        self.filter_hits = 0            # Filter said "maybe present", tree was searched
+        self.filter_misses = 0          # Filter said "definitely absent", tree was skipped
+        self.filter_false_positives = 0 # Filter hit but the tree did not contain the key
+        self.filter_rebuilds = 0
+        if use_bloom_filter:
+            self.bloom_filter = BloomFilter(expected_items, false_positive_rate)
 
     def insert(self, data: Any) -> bool:
         '''
@@ -41,27 +172,40 @@ class BinarySearchTree:
         '''
         self.operation_count += 1
         if self.root is None:
-            self.root = BSTNode(data)
+            self.root = self._new_node(data)
             self.size += 1
+            self._filter_add(data)
             return True
         else:
             result = self._insert_recursive(self.root, data)
             if result:
                 self.size += 1
+                self._filter_add(data)
             return result
 
+    def _new_node(self, data: Any) -> BSTNode:
+        # Allocate a node, from the pool when one is attached
+        if self.node_pool is not None:
+            return self.node_pool.acquire(data)
+        return BSTNode(data)
+
+    def _free_node(self, node: BSTNode):
+        # Hand a detached node back to the pool (no-op without a pool)
+        if self.node_pool is not None:
+            self.node_pool.release(node)
+
     def _insert_recursive(self, node: BSTNode, data: Any) -> bool:
         # Helper method for recursive insertion
         try:
             if data < node.data:
                 if node.left is None:
-                    node.left = BSTNode(data)
+                    node.left = self._new_node(data)
                     return True
                 else:
                     return self._insert_recursive(node.left, data)
             elif data > node.data:
                 if node.right is None:
-                    node.right = BSTNode(data)
+                    node.right = self._new_node(data)
                     return True
                 else:
                     return self._insert_recursive(node.right, data)
@@ -77,6 +221,20 @@ class BinarySearchTree:
         Returns True if found, False otherwise
         '''
         self.operation_count += 1
+        if self.bloom_filter is not None:
+            try:
+                maybe_present = self.bloom_filter.might_contain(data)
+            except TypeError:
+                # Unhashable value: search the tree without touching the filter statistics
+                return self._search_recursive(self.root, data)
+            if not maybe_present:
+                self.filter_misses += 1
+                return False
+            self.filter_hits += 1
+            found = self._search_recursive(self.root, data)
+            if not found:
+                self.filter_false_positives += 1
+            return found
         return self._search_recursive(self.root, data)
 
     def _search_recursive(self, node: Optional[BSTNode], data: Any) -> bool:
@@ -103,9 +261,40 @@ class BinarySearchTree:
         initial_size = self.size
         self.root = self._delete_recursive(self.root, data)
         if self.size < initial_size:
+            if self.bloom_filter is not None:
+                # Bloom filters cannot remove keys, so rebuild once enough stale keys pile up
+                self.deletes_since_rebuild += 1
+                if self.deletes_since_rebuild > self.rebuild_ratio * max(self.size, 1):
+                    self.rebuild_filter()
             return True
         return False
 
+    def _filter_add(self, data: Any):
+        # Record a newly inserted key in the Bloom filter, growing it when over capacity
+        if self.bloom_filter is None:
+            return
+        try:
+            self.bloom_filter.add(data)
+        except TypeError:
+            return
+        if self.bloom_filter.is_saturated():
+            self.rebuild_filter()
+
+    def rebuild_filter(self):
+        '''
+        Rebuild the Bloom filter from the keys currently in the tree
+        Drops deleted keys and resizes for twice the current size
+        '''
+        if self.bloom_filter is None:
+            return
+        keys = self.inorder_traversal()
+        capacity = max(self.bloom_filter.capacity, 2 * len(keys))
+        self.bloom_filter = BloomFilter(capacity, self.false_positive_rate)
+        for key in keys:
+            self.bloom_filter.add(key)
+        self.deletes_since_rebuild = 0
+        self.filter_rebuilds += 1
+
     def _delete_recursive(self, node: Optional[BSTNode], data: Any) -> Optional[BSTNode]:
         # Helper method for recursive deletion
         if node is None:
@@ -122,13 +311,18 @@ class BinarySearchTree:
 
                 # Case 1: Node with no children
                 if node.left is None and node.right is None:
+                    self._free_node(node)
                     return None
 
                 # Case 2: Node with one child
                 elif node.left is None:
-                    return node.right
+                    child = node.right
+                    self._free_node(node)
+                    return child
                 elif node.right is None:
-                    return node.left
+                    child = node.left
+                    self._free_node(node)
+                    return child
 
                 # Case 3: Node with two children
                 else:
@@ -142,6 +336,22 @@ class BinarySearchTree:
         except TypeError:
             return node
 
+    def clear(self):
+        # Remove every node, returning them to the pool when one is attached
+        if self.node_pool is not None:
+            stack = [self.root] if self.root is not None else []
+            while stack:
+                node = stack.pop()
+                if node.left is not None:
+                    stack.append(node.left)
+                if node.right is not None:
+                    stack.append(node.right)
+                self.node_pool.release(node)
+        self.root = None
+        self.size = 0
+        if self.bloom_filter is not None:
+            self.rebuild_filter()
+
     def _find_min(self, node: BSTNode) -> BSTNode:
         # Find minimum value node in subtree
         while node.left is not None:
@@ -227,18 +437,67 @@ class BinarySearchTree:
         except TypeError:
             pass
 
+    def successor(self, data: Any) -> Optional[Any]:
+        # Smallest value strictly greater than data (None if there is none)
+        node = self.root
+        best = None
+        try:
+            while node is not None:
+                if node.data > data:
+                    best = node.data
+                    node = node.left
+                else:
+                    node = node.right
+        except TypeError:
+            return None
+        return best
+
+    def predecessor(self, data: Any) -> Optional[Any]:
+        # Largest value strictly smaller than data (None if there is none)
+        node = self.root
+        best = None
+        try:
+            while node is not None:
+                if node.data < data:
+                    best = node.data
+                    node = node.right
+                else:
+                    node = node.left
+        except TypeError:
+            return None
+        return best
+
     def get_statistics(self) -> dict:
         # Get comprehensive tree statistics
         if not self.root:
-            return {"size": 0, "height": 0, "operations": self.operation_count}
-
+            stats = {"size": 0, "height": 0, "operations": self.operation_count}
+        else:
+            stats = {
+                "size": self.size,
+                "height": self.get_height(),
+                "operations": self.operation_count,
+                "is_balanced": self._is_balanced(),
+                "min_value": self._find_min(self.root).data if self.root else None,
+                "max_value": self._find_max(self.root).data if self.root else None,
+            }
+
+        if self.bloom_filter is not None:
+            stats.update(self.get_filter_statistics())
+        if self.node_pool is not None:
+            stats.update(self.node_pool.get_statistics(self.operation_count))
+        return stats
+
+    def get_filter_statistics(self) -> dict:
+        # Bloom filter counters (empty when the filter is disabled)
+        if self.bloom_filter is None:
+            return {}
         return {
-            "size": self.size,
-            "height": self.get_height(),
-            "operations": self.operation_count,
-            "is_balanced": self._is_balanced(),
-            "min_value": self._find_min(self.root).data if self.root else None,
-            "max_value": self._find_max(self.root).data if self.root else None,
+            "filter_hits": self.filter_hits,
+            "filter_misses": self.filter_misses,
+            "filter_false_positives": self.filter_false_positives,
+            "filter_rebuilds": self.filter_rebuilds,
+            "filter_bits": self.bloom_filter.num_bits,
+            "filter_hashes": self.bloom_filter.num_hashes,
         }
 
     def _is_balanced(self) -> bool:
@@ -292,6 +551,238 @@ class BinarySearchTree:
             new_prefix = " " * prefix_len + ("    " if is_tail else "│   ")
             self._build_tree_string(node.left, len(new_prefix), True, "└── ", lines)
 
+class IntegerOrderedSet:
+    '''
+    Ordered set specialised for non-negative integer keys in [0, universe)
+    Bitmap-summarised radix trie: every level packs 64 children into one machine word,
+    and each bit in a level says whether the word below it is non-empty.
+    Operations cost O(log_64 U) word operations (4 levels for U = 2^24) and memory is
+    one bit per possible key, far smaller than one BSTNode per key for dense ranges.
+    Offers the same insert/search/delete/find_range/successor API as BinarySearchTree.
+    '''
+
+    WORD_BITS = 64
+    WORD_SHIFT = 6
+    WORD_MASK = 63
+
+    def __init__(self, universe: int):
+        if universe <= 0:
+            raise ValueError("universe must be a positive integer")
+        self.universe = universe
+        self.size = 0
+        self.operation_count = 0  # Track operations for analysis
+
+        # levels[0] holds the key bits, levels[-1] is a single summary word
+        self.levels: List[array] = []
+        words = (universe + self.WORD_MASK) >> self.WORD_SHIFT
+        while True:
+            self.levels.append(array('Q', bytes(8 * words)))
+            if words == 1:
+                break
+            words = (words + self.WORD_MASK) >> self.WORD_SHIFT
+
+    def _valid_key(self, data: Any) -> bool:
+        # Only plain ints inside the declared universe are storable
+        return type(data) is int and 0 <= data < self.universe
+
+    def insert(self, data: Any) -> bool:
+        '''
+        Insert an integer key
+        Returns True if insertion successful, False if duplicate or outside the universe
+        '''
+        self.operation_count += 1
+        if not self._valid_key(data):
+            print(f"Error: {data!r} is not an integer in [0, {self.universe}). Integer sets only hold keys in their universe")
+            return False
+
+        levels = self.levels
+        word_index = data >> self.WORD_SHIFT
+        bit = 1 << (data & self.WORD_MASK)
+        if levels[0][word_index] & bit:
+            return False  # Duplicate value
+        self.size += 1
+
+        # Set the bit on each level until we reach a word that was already non-empty
+        for level in levels:
+            was_empty = level[word_index] == 0
+            level[word_index] |= bit
+            if not was_empty:
+                break
+            bit = 1 << (word_index & self.WORD_MASK)
+            word_index >>= self.WORD_SHIFT
+        return True
+
+    def search(self, data: Any) -> bool:
+        '''
+        Search for an integer key
+        Returns True if found, False otherwise
+        '''
+        self.operation_count += 1
+        if not self._valid_key(data):
+            return False
+        return bool(self.levels[0][data >> self.WORD_SHIFT] & (1 << (data & self.WORD_MASK)))
+
+    def delete(self, data: Any) -> bool:
+        '''
+        Delete an integer key
+        Returns True if deletion successful, False if not found
+        '''
+        self.operation_count += 1
+        if not self._valid_key(data):
+            return False
+
+        levels = self.levels
+        word_index = data >> self.WORD_SHIFT
+        bit = 1 << (data & self.WORD_MASK)
+        if not levels[0][word_index] & bit:
+            return False
+        self.size -= 1
+
+        # Clear the bit on each level while the word below became empty
+        for level in levels:
+            level[word_index] &= ~bit
+            if level[word_index]:
+                break
+            bit = 1 << (word_index & self.WORD_MASK)
+            word_index >>= self.WORD_SHIFT
+        return True
+
+    def _first_at_or_after(self, key: int) -> Optional[int]:
+        # Smallest stored key >= key, climbing summaries until a later bit is found
+        if key < 0:
+            key = 0
+        if key >= self.universe:
+            return None
+
+        levels = self.levels
+        depth = 0
+        pos = key
+        while depth < len(levels):
+            word_index = pos >> self.WORD_SHIFT
+            level = levels[depth]
+            if word_index >= len(level):
+                return None
+            word = (level[word_index] >> (pos & self.WORD_MASK)) << (pos & self.WORD_MASK)
+            if word:
+                pos = (word_index << self.WORD_SHIFT) | ((word & -word).bit_length() - 1)
+                # Descend through the lowest set bit of each child word
+                while depth > 0:
+                    depth -= 1
+                    word = levels[depth][pos]
+                    pos = (pos << self.WORD_SHIFT) | ((word & -word).bit_length() - 1)
+                return pos
+            pos = word_index + 1
+            depth += 1
+        return None
+
+    def _last_at_or_before(self, key: int) -> Optional[int]:
+        # Largest stored key <= key, mirror image of _first_at_or_after
+        if key < 0:
+            return None
+        if key >= self.universe:
+            key = self.universe - 1
+
+        levels = self.levels
+        depth = 0
+        pos = key
+        while depth < len(levels):
+            if pos < 0:
+                return None
+            word_index = pos >> self.WORD_SHIFT
+            keep = (pos & self.WORD_MASK) + 1
+            word = levels[depth][word_index] & ((1 << keep) - 1)
+            if word:
+                pos = (word_index << self.WORD_SHIFT) | (word.bit_length() - 1)
+                # Descend through the highest set bit of each child word
+                while depth > 0:
+                    depth -= 1
+                    word = levels[depth][pos]
+                    pos = (pos << self.WORD_SHIFT) | (word.bit_length() - 1)
+                return pos
+            pos = word_index - 1
+            depth += 1
+        return None
+
+    def _integer_bound(self, value: Any, round_up: bool) -> Optional[int]:
+        # Query value as an integer clamped to [-1, universe]; None when it is not a real number
+        if not isinstance(value, numbers.Real) or value != value:  # value != value catches NaN
+            return None
+        if value < 0:
+            return -1
+        if value >= self.universe:
+            return self.universe
+        return math.ceil(value) if round_up else math.floor(value)
+
+    def successor(self, data: Any) -> Optional[int]:
+        # Smallest key strictly greater than data (None if there is none)
+        bound = self._integer_bound(data, round_up=False)
+        if bound is None:
+            return None
+        return self._first_at_or_after(bound + 1)
+
+    def predecessor(self, data: Any) -> Optional[int]:
+        # Largest key strictly smaller than data (None if there is none)
+        bound = self._integer_bound(data, round_up=True)
+        if bound is None:
+            return None
+        return self._last_at_or_before(bound - 1)
+
+    def find_range(self, min_val: Any, max_val: Any) -> List[int]:
+        # Find all keys in given range [min_val, max_val] in ascending order
+        result = []
+        low = self._integer_bound(min_val, round_up=True)
+        high = self._integer_bound(max_val, round_up=False)
+        if low is None or high is None:
+            return result
+        key = self._first_at_or_after(low)
+        while key is not None and key <= high:
+            result.append(key)
+            key = self._first_at_or_after(key + 1)
+        return result
+
+    def inorder_traversal(self) -> List[int]:
+        # Return all keys in sorted order (same contract as the BST)
+        return self.find_range(0, self.universe - 1)
+
+    def get_height(self) -> int:
+        # Number of trie levels, fixed by the universe size
+        return len(self.levels)
+
+    def memory_bytes(self) -> int:
+        # Bytes used by the bitmap levels (excluding fixed object overhead)
+        return sum(level.itemsize * len(level) for level in self.levels)
+
+    def get_statistics(self) -> dict:
+        # Get statistics compatible with BinarySearchTree.get_statistics
+        if self.size == 0:
+            return {"size": 0, "height": 0, "operations": self.operation_count}
+
+        return {
+            "size": self.size,
+            "height": self.get_height(),
+            "operations": self.operation_count,
+            "is_balanced": True,  # Every key sits at the same depth
+            "min_value": self._first_at_or_after(0),
+            "max_value": self._last_at_or_before(self.universe - 1),
+            "universe": self.universe,
+            "memory_bytes": self.memory_bytes(),
+        }
+
+def create_ordered_set(values: Optional[List[Any]] = None, universe: Optional[int] = None):
+    '''
+    Pick the best ordered-set backend for the given keys
+    Uses IntegerOrderedSet when a universe is declared and every key is an int in [0, universe),
+    otherwise falls back to the general comparison-based BinarySearchTree
+    '''
+    values = list(values) if values is not None else []
+    if universe is not None and all(type(val) is int and 0 <= val < universe for val in values):
+        ordered_set = IntegerOrderedSet(universe)
+    else:
+        ordered_set = BinarySearchTree()
+    for val in values:
+        ordered_set.insert(val)
+    return ordered_set
+
 class BSTTester:
     '''
     Comprehensive testing module for BST operations
@@ -400,6 +891,81 @@ class BSTTester:
 
         return True # Placeholder to demonstrate program's ability
 
+    @staticmethod
+    def run_bloom_filter_tests() -> bool:
+        # Test the Bloom filter front on a miss-heavy search workload
+        print("\n" + "=" * 50)
+        print("RUNNING BLOOM FILTER TESTS")
+        print("=" * 50)
+
+        bst = BinarySearchTree(use_bloom_filter=True, false_positive_rate=0.01, expected_items=16)
+        for val in range(0, 200, 2):
+            bst.insert(val)
+
+        # Every stored key must still be found (no false negatives)
+        all_found = all(bst.search(val) for val in range(0, 200, 2))
+        print(f"All inserted keys found: {all_found}")
+
+        # Odd keys are never stored, most should be rejected by the filter
+        for val in range(1, 2000, 2):
+            bst.search(val)
+        stats = bst.get_filter_statistics()
+        print(f"Filter hits: {stats['filter_hits']}, misses: {stats['filter_misses']}, "
+              f"false positives: {stats['filter_false_positives']}")
+
+        # Deleting many keys triggers a rebuild that drops them from the filter
+        for val in range(0, 100, 2):
+            bst.delete(val)
+        print(f"Deleted key 10 found: {bst.search(10)}")
+        print(f"Filter rebuilds: {bst.filter_rebuilds}")
+
+        return all_found
+
+    @staticmethod
+    def run_integer_set_tests() -> bool:
+        # Test the integer-specialised backend against the BST
+        print("\n" + "=" * 50)
+        print("RUNNING INTEGER SET TESTS")
+        print("=" * 50)
+
+        test_data = [50, 30, 70, 20, 40, 60, 80]
+        int_set = create_ordered_set(test_data, universe=1 << 16)
+        bst = create_ordered_set(test_data)
+        print(f"Backend with universe: {type(int_set).__name__}, without: {type(bst).__name__}")
+
+        same_order = int_set.inorder_traversal() == bst.inorder_traversal()
+        print(f"Same sorted order as BST: {same_order}")
+        print(f"Successor of 45: {int_set.successor(45)} (BST: {bst.successor(45)})")
+        print(f"Range [25, 65]: {int_set.find_range(25, 65)}")
+        print(f"Delete 60: {int_set.delete(60)}, search 60: {int_set.search(60)}")
+        print(f"Bitmap memory for universe 2^16: {int_set.memory_bytes()} bytes")
+
+        return same_order
+
+    @staticmethod
+    def run_node_pool_tests() -> bool:
+        # Test node reuse under steady-state insert/delete churn
+        print("\n" + "=" * 50)
+        print("RUNNING NODE POOL TESTS")
+        print("=" * 50)
+
+        pool = NodePool()
+        bst = BinarySearchTree(node_pool=pool)
+        for i in range(500):
+            bst.insert((i * 7) % 500)
+        warm_allocations = pool.allocations
+
+        # Churn: delete one key and insert another, tree size stays stable
+        for i in range(2000):
+            bst.delete((i * 7) % 500)
+            bst.insert((i * 7) % 500)
+        stats = bst.get_statistics()
+        print(f"Allocations while building: {warm_allocations}")
+        print(f"Allocations during churn: {pool.allocations - warm_allocations}")
+        print(f"Reused nodes: {stats['pool_reuses']}, allocations/op: {stats['allocations_per_op']:.4f}")
+
+        return pool.allocations == warm_allocations
+
 def display_menu():
     # Display interactive menu options
     print("\n" + "=" * 70)
@@ -427,6 +993,7 @@ def display_menu():
     print("🧪 TESTING & UTILITIES:")
     print("11. Run automated test cases")
     print("12. Reset/Clear tree")
+    print("13. Choose ordered-set backend (general BST / integer universe)")
     print("0.  Exit program")
     print("=" * 70)
 
@@ -575,6 +1142,41 @@ def guided_multiple_insert(bst: BinarySearchTree) -> None:
     # Use unified continue choice function
     ask_continue_choice()
 
+def choose_backend(ordered_set):
+    '''
+    Rebuild the current elements on a backend picked by the user
+    The integer backend is used only when every element is an int in [0, universe);
+    create_ordered_set falls back to the general BST otherwise
+    '''
+    print("\n" + "=" * 50)
+    print("⚙️  ORDERED-SET BACKEND")
+    print("=" * 50)
+    current = "integer universe" if isinstance(ordered_set, IntegerOrderedSet) else "general BST"
+    print(f"Current backend: {current}")
+    print("1. General BST (any comparable type)")
+    print("2. Integer universe (non-negative integers below a fixed bound)")
+
+    choice = input("Choose backend (1-2): ").strip()
+    if choice == '1':
+        universe = None
+    elif choice == '2':
+        bound = input("Enter the universe size (keys must be in [0, universe)): ").strip()
+        if not bound.isdigit() or int(bound) <= 0:
+            print("❌ The universe size must be a positive integer.")
+            return ordered_set
+        universe = int(bound)
+    else:
+        print("❌ Invalid choice. Backend unchanged.")
+        return ordered_set
+
+    rebuilt = create_ordered_set(ordered_set.inorder_traversal(), universe)
+    if universe is not None and not isinstance(rebuilt, IntegerOrderedSet):
+        print(f"⚠️  Current elements are not all integers in [0, {universe}); keeping the general BST.")
+    else:
+        backend = "integer universe" if isinstance(rebuilt, IntegerOrderedSet) else "general BST"
+        print(f"✅ Now using the {backend} backend ({rebuilt.size} elements).")
+    return rebuilt
+
 def main():
     '''
     Main program function with interactive menu
@@ -584,13 +1186,13 @@ def main():
     print("This program demonstrates a complete Binary Search Tree implementation")
     print("with comprehensive operations and visualizations.")
 
-    bst = BinarySearchTree()
+    bst = create_ordered_set()
 
     while True:
         display_menu()
 
         try:
-            choice = input("\nEnter your choice (0-12): ").strip()
+            choice = input("\nEnter your choice (0-13): ").strip()
 
             if choice == '0':
                 print("👋 Thank you for using our BST program!")
@@ -733,6 +1335,9 @@ def main():
                 if bst.size == 0:
                     print("❌ Tree is empty! Please insert some elements first.")
                     continue
+                if isinstance(bst, IntegerOrderedSet):
+                    print("❌ The integer universe backend has no tree structure to display.")
+                    continue
                 print(f"\n🌳 TREE STRUCTURE VISUALIZATION:")
                 print("=" * 40)
                 print(bst.visualize_tree())
@@ -756,6 +1361,9 @@ def main():
                 if bst.size == 0:
                     print("❌ Tree is empty! Please insert some elements first.")
                     continue
+                if isinstance(bst, IntegerOrderedSet):
+                    print("❌ Preorder traversal is only available on the general BST backend.")
+                    continue
                 result = bst.preorder_traversal()
                 print(f"\n📊 Preorder traversal: {result}")
                 print("💡 This shows: Root → Left → Right")
@@ -767,6 +1375,9 @@ def main():
                 if bst.size == 0:
                     print("❌ Tree is empty! Please insert some elements first.")
                     continue
+                if isinstance(bst, IntegerOrderedSet):
+                    print("❌ Postorder traversal is only available on the general BST backend.")
+                    continue
                 result = bst.postorder_traversal()
                 print(f"\n📊 Postorder traversal: {result}")
                 print("💡 This shows: Left → Right → Root")
@@ -780,11 +1391,18 @@ def main():
                 print("=" * 40)
                 print(f"  📏 Tree size: {stats['size']} nodes")
                 print(f"  📐 Tree height: {stats['height']}")
-                print(f"  ⚖️  Is balanced: {'Yes' if stats['is_balanced'] else 'No'}")
+                print(f"  ⚖️  Is balanced: {'Yes' if stats.get('is_balanced', True) else 'No'}")
                 print(f"  🔢 Operations performed: {stats['operations']}")
                 if stats['size'] > 0:
                     print(f"  📉 Minimum value: {stats['min_value']}")
                     print(f"  📈 Maximum value: {stats['max_value']}")
+                if 'pool_allocations' in stats:
+                    print(f"  ♻️  Node allocations/reuses: {stats['pool_allocations']}/{stats['pool_reuses']}")
+                if 'universe' in stats:
+                    print(f"  🔢 Integer universe: [0, {stats['universe']}), {stats['memory_bytes']} bytes of bitmaps")
+                if 'filter_hits' in stats:
+                    print(f"  🧮 Bloom filter hits/misses: {stats['filter_hits']}/{stats['filter_misses']}")
+                    print(f"  ⚠️  Bloom filter false positives: {stats['filter_false_positives']}")
                 print("=" * 40)
 
                 # Use unified continue choice function
@@ -797,6 +1415,9 @@ def main():
                 BSTTester.run_basic_tests()
                 BSTTester.run_edge_case_tests()
                 BSTTester.run_type_tests()
+                BSTTester.run_bloom_filter_tests()
+                BSTTester.run_integer_set_tests()
+                BSTTester.run_node_pool_tests()
                 print("\n✅ All test cases completed!")
 
                 # Use unified continue choice function
@@ -810,7 +1431,7 @@ def main():
 
                 confirm = input(f"⚠️  Are you sure you want to clear the tree? ({bst.size} nodes will be lost) [y/n]: ").lower()
                 if confirm == 'y':
-                    bst = BinarySearchTree()
+                    bst = create_ordered_set(universe=getattr(bst, 'universe', None))
                     print("✅ Tree cleared successfully!")
                 else:
                     print("❌ Operation cancelled.")
@@ -818,8 +1439,12 @@ def main():
                 # Use unified continue choice function
                 ask_continue_choice()
 
+            elif choice == '13':
+                bst = choose_backend(bst)
+                ask_continue_choice()
+
             else:
-                print("❌ Invalid choice. Please enter a number between 0 and 12.")
+                print("❌ Invalid choice. Please enter a number between 0 and 13.")
 
         except KeyboardInterrupt:
             print("\n\n⚠️  Program interrupted by user.")
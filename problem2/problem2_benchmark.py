@@ -0,0 +1,499 @@
+'''
+CSC2103 Data Structures and Algorithms
+Problem 2: Dijkstra's Algorithm - Performance Benchmarks
+
+This program generates synthetic graphs and times the shortest path engines
+implemented in problem2_dijkstra.py, so different priority queues and graph
+representations can be compared on graphs far larger than graph_edges.csv.
+
+Run from the problem2 directory:  python problem2_benchmark.py
+'''
+
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from problem2_dijkstra import (CSRGraph, CountingHeap, LandmarkIndex, ReachabilityIndex, SearchStats, SearchWorkspace,
+                               build_reverse_graph, dijkstra, dijkstra_csr, distance_table, load_graph_from_csv,
+                               make_heap, select_heap, shortest_path)
+
+def random_graph(num_nodes, num_edges, max_weight=100, seed=0):
+    """Random directed graph as a dict of dicts with labels N0..N{n-1}"""
+    rng = random.Random(seed)
+    labels = [f"N{i}" for i in range(num_nodes)]
+    graph = {label: {} for label in labels}
+    # A ring keeps every node reachable from N0
+    for i in range(num_nodes):
+        graph[labels[i]][labels[(i + 1) % num_nodes]] = rng.randint(1, max_weight)
+    added = num_nodes
+    while added < num_edges:
+        u = labels[rng.randrange(num_nodes)]
+        v = labels[rng.randrange(num_nodes)]
+        if u != v and v not in graph[u]:
+            graph[u][v] = rng.randint(1, max_weight)
+            added += 1
+    return graph
+
+def grid_graph(rows, cols, max_weight=10, seed=0):
+    """Road-like grid where each cell links to its four neighbours in both directions"""
+    rng = random.Random(seed)
+    graph = {f"R{r}C{c}": {} for r in range(rows) for c in range(cols)}
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in ((0, 1), (1, 0)):
+                nr, nc = r + dr, c + dc
+                if nr < rows and nc < cols:
+                    weight = rng.randint(1, max_weight)
+                    graph[f"R{r}C{c}"][f"R{nr}C{nc}"] = weight
+                    graph[f"R{nr}C{nc}"][f"R{r}C{c}"] = weight
+    return graph
+
+def scale_free_graph(num_nodes, edges_per_node=2, max_weight=100, seed=0):
+    """
+    Barabasi-Albert style graph: each new node links to edges_per_node existing
+    nodes chosen proportionally to their degree, in both directions, giving a few
+    heavily connected hubs and many low-degree nodes
+    """
+    rng = random.Random(seed)
+    labels = [f"N{i}" for i in range(num_nodes)]
+    graph = {label: {} for label in labels}
+    core = min(num_nodes, edges_per_node + 1)
+    endpoints = []   # Every edge endpoint once, so a uniform pick is degree-proportional
+    for i in range(core):
+        for j in range(i + 1, core):
+            weight = rng.randint(1, max_weight)
+            graph[labels[i]][labels[j]] = weight
+            graph[labels[j]][labels[i]] = weight
+            endpoints += [i, j]
+    for i in range(core, num_nodes):
+        chosen = set()
+        while len(chosen) < edges_per_node:
+            chosen.add(rng.choice(endpoints))
+        for j in chosen:
+            weight = rng.randint(1, max_weight)
+            graph[labels[i]][labels[j]] = weight
+            graph[labels[j]][labels[i]] = weight
+            endpoints += [i, j]
+    return graph
+
+def road_graph(rows, cols, seed=0):
+    """
+    Road-network-like graph: jittered grid intersections joined by two-way streets
+    weighted by length, with about 10% of streets missing, occasional diagonal
+    links and a sparse grid of faster "highways" every 10 blocks
+    """
+    rng = random.Random(seed)
+    points = {(r, c): (r + rng.uniform(-0.3, 0.3), c + rng.uniform(-0.3, 0.3)) for r in range(rows) for c in range(cols)}
+    graph = {f"R{r}C{c}": {} for r, c in points}
+
+    def link(a, b, speed=1.0):
+        (ay, ax), (by, bx) = points[a], points[b]
+        weight = max(1, round(10 * ((ay - by) ** 2 + (ax - bx) ** 2) ** 0.5 / speed))
+        graph[f"R{a[0]}C{a[1]}"][f"R{b[0]}C{b[1]}"] = weight
+        graph[f"R{b[0]}C{b[1]}"][f"R{a[0]}C{a[1]}"] = weight
+
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in ((0, 1), (1, 0)):
+                if r + dr < rows and c + dc < cols and rng.random() >= 0.1:
+                    link((r, c), (r + dr, c + dc))
+            if r + 1 < rows and c + 1 < cols and rng.random() < 0.05:
+                link((r, c), (r + 1, c + 1))
+            # Highways along every tenth row and column, three times faster
+            if r % 10 == 0 and c % 10 == 0:
+                if c + 10 < cols:
+                    link((r, c), (r, c + 10), speed=3.0)
+                if r + 10 < rows:
+                    link((r, c), (r + 10, c), speed=3.0)
+    return graph
+
+def write_edge_csv(graph, filename):
+    """Write a dict-of-dicts graph in the graph_edges.csv format"""
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write("source,destination,weight\n")
+        for source in graph:
+            for destination, weight in graph[source].items():
+                file.write(f"{source},{destination},{weight}\n")
+
+def time_call(func, *args, repeat=3, **kwargs):
+    """Best wall-clock time of repeat calls, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def peak_memory(func, *args, **kwargs):
+    """Peak bytes allocated by Python while func runs (traced separately from the timings)"""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def print_results(title, rows):
+    """Print (label, seconds) rows relative to the first row"""
+    print(f"\n{title}")
+    print("┌" + "─" * 30 + "┬" + "─" * 12 + "┬" + "─" * 10 + "┐")
+    print(f"│{'Engine':<30}│{'Time (ms)':<12}│{'Speedup':<10}│")
+    print("├" + "─" * 30 + "┼" + "─" * 12 + "┼" + "─" * 10 + "┤")
+    baseline = rows[0][1]
+    for label, seconds in rows:
+        print(f"│{label:<30}│{seconds * 1000:<12.2f}│{baseline / seconds:<10.2f}│")
+    print("└" + "─" * 30 + "┴" + "─" * 12 + "┴" + "─" * 10 + "┘")
+
+def benchmark_heaps(scale=1):
+    """Lazy-deletion MinHeap versus IndexedMinHeap (binary/4-ary/8-ary) on sparse and dense graphs"""
+    cases = [
+        ("Sparse graph", 5000 * scale, 20000 * scale),
+        ("Dense graph", 400 * scale, 400 * 200 * scale),
+    ]
+    engines = [
+        ("lazy binary", 'lazy', 2),
+        ("lazy 4-ary", 'lazy', 4),
+        ("indexed binary", 'indexed', 2),
+        ("indexed 4-ary", 'indexed', 4),
+        ("indexed 8-ary", 'indexed', 8),
+    ]
+    for title, num_nodes, num_edges in cases:
+        graph = random_graph(num_nodes, num_edges)
+        csr = CSRGraph.from_dict(graph)
+        rows = []
+        for label, heap, arity in engines:
+            rows.append((label, time_call(dijkstra, graph, "N0", heap=heap, arity=arity)))
+        for label, heap, arity in engines[:1] + engines[2:3]:
+            rows.append((f"CSR {label}", time_call(dijkstra, csr, "N0", heap=heap, arity=arity)))
+        print_results(f"{title}: {num_nodes} nodes, {num_edges} edges", rows)
+
+def benchmark_heap_memory(scale=1):
+    """Peak heap entries and traced memory of the lazy, indexed and compacting heaps on dense graphs"""
+    num_nodes = 1000 * scale
+    # Complete DAG where every settled node improves every later node: O(V^2) stale entries
+    dag_nodes = 600 * scale
+    worst_case = {f"N{i}": {f"N{j}": (1 if j == i + 1 else 2 * (dag_nodes - i)) for j in range(i + 1, dag_nodes)}
+                  for i in range(dag_nodes)}
+    cases = [("Dense random graph", random_graph(num_nodes, num_nodes * num_nodes // 4)),
+             ("Dense worst-case graph", worst_case)]
+    for title, graph in cases:
+        graph = CSRGraph.from_dict(graph)
+        print(f"\n{title}: {graph.num_nodes} nodes, {graph.num_edges} edges")
+        print("┌" + "─" * 20 + "┬" + "─" * 12 + "┬" + "─" * 14 + "┬" + "─" * 12 + "┐")
+        print(f"│{'Heap':<20}│{'Time (ms)':<12}│{'Peak entries':<14}│{'Peak KiB':<12}│")
+        print("├" + "─" * 20 + "┼" + "─" * 12 + "┼" + "─" * 14 + "┼" + "─" * 12 + "┤")
+        for label, heap in (("lazy binary", 'lazy'), ("indexed binary", 'indexed'), ("compacting lazy", 'compact')):
+            seconds = time_call(dijkstra, graph, "N0", heap=heap)
+            stats = SearchStats()
+            queue = make_heap(heap)
+            dijkstra(graph, "N0", heap=CountingHeap(queue, stats))
+            # The compacting heap's len() counts live entries only, so read its own peak
+            entries = getattr(queue, 'peak_entries', stats.peak_heap)
+            kib = peak_memory(dijkstra, graph, "N0", heap=heap) / 1024
+            print(f"│{label:<20}│{seconds * 1000:<12.2f}│{entries:<14}│{kib:<12.1f}│")
+        print("└" + "─" * 20 + "┴" + "─" * 12 + "┴" + "─" * 14 + "┴" + "─" * 12 + "┘")
+
+def benchmark_integer_queues(scale=1):
+    """Binary heap versus Dial's buckets and the radix heap as the maximum integer weight grows"""
+    num_nodes = 20000 * scale
+    engines = [("lazy binary", 'lazy'), ("indexed binary", 'indexed'), ("Dial buckets", 'dial'),
+               ("radix heap", 'radix'), ("auto", 'auto')]
+    for max_weight in (10, 1000, 100000):
+        csr = CSRGraph.from_dict(random_graph(num_nodes, 4 * num_nodes, max_weight=max_weight))
+        rows = [(label, time_call(dijkstra, csr, "N0", heap=heap)) for label, heap in engines]
+        print_results(f"Integer weights 1..{max_weight}: CSR graph with {num_nodes} nodes, "
+                      f"auto picks '{select_heap(csr)[0]}'", rows)
+
+def benchmark_point_to_point(num_queries=20, scale=1):
+    """Full single-source dijkstra versus early-exit and bidirectional point-to-point queries"""
+    num_nodes = 10000 * scale
+    graph = random_graph(num_nodes, 4 * num_nodes)
+    reverse_graph = build_reverse_graph(graph)
+    rng = random.Random(1)
+    queries = [(f"N{rng.randrange(num_nodes)}", f"N{rng.randrange(num_nodes)}") for _ in range(num_queries)]
+
+    def run(method):
+        for start, end in queries:
+            if method == 'full':
+                dijkstra(graph, start)
+            else:
+                shortest_path(graph, start, end, method=method, reverse_graph=reverse_graph)
+
+    rows = [
+        ("full dijkstra", time_call(run, 'full', repeat=1)),
+        ("early exit", time_call(run, 'dijkstra', repeat=1)),
+        ("bidirectional", time_call(run, 'bidirectional', repeat=1)),
+    ]
+    print_results(f"{num_queries} point-to-point queries: {num_nodes} nodes, {4 * num_nodes} edges", rows)
+
+def benchmark_goal_directed(num_queries=20, num_landmarks=8, scale=1):
+    """A*/ALT versus Dijkstra point-to-point queries, including landmark preprocessing cost"""
+    side = 100 * scale
+    graph = grid_graph(side, side)
+    reverse_graph = build_reverse_graph(graph)
+    labels = list(graph)
+    rng = random.Random(2)
+    queries = [(rng.choice(labels), rng.choice(labels)) for _ in range(num_queries)]
+
+    landmarks = LandmarkIndex(graph, num_landmarks, reverse_graph)
+    print(f"\nLandmark preprocessing ({num_landmarks} landmarks, {len(labels)} nodes): "
+          f"{landmarks.preprocess_seconds * 1000:.1f} ms, {landmarks.memory_bytes() / 1024:.1f} KiB of distances")
+
+    def run(method):
+        for start, end in queries:
+            shortest_path(graph, start, end, method=method, reverse_graph=reverse_graph, landmarks=landmarks)
+
+    rows = [(method, time_call(run, method, repeat=1)) for method in ('dijkstra', 'bidirectional', 'astar', 'alt')]
+    print_results(f"{num_queries} point-to-point queries on a {side}x{side} grid", rows)
+
+def benchmark_contraction_hierarchies(num_queries=200, scale=1):
+    """Contraction Hierarchies preprocessing cost and query time versus bidirectional Dijkstra"""
+    from problem2_contractionHierarchies import ContractionHierarchy
+
+    side = 40 * scale
+    graph = grid_graph(side, side)
+    reverse_graph = build_reverse_graph(graph)
+    labels = list(graph)
+    rng = random.Random(3)
+    queries = [(rng.choice(labels), rng.choice(labels)) for _ in range(num_queries)]
+
+    hierarchy = ContractionHierarchy.build(graph)
+    print(f"\nContraction Hierarchies preprocessing ({len(labels)} nodes): "
+          f"{hierarchy.preprocess_seconds * 1000:.1f} ms, {hierarchy.num_shortcuts} shortcuts")
+
+    def run(method):
+        for start, end in queries:
+            if method == 'ch':
+                hierarchy.query(start, end)
+            else:
+                shortest_path(graph, start, end, method=method, reverse_graph=reverse_graph)
+
+    rows = [(method, time_call(run, method, repeat=1)) for method in ('dijkstra', 'bidirectional', 'ch')]
+    print_results(f"{num_queries} point-to-point queries on a {side}x{side} grid", rows)
+
+def benchmark_many_to_many(num_sources=20, num_targets=50, scale=1):
+    """Depot-to-customer distance tables: one dijkstra per source versus distance_table and CH buckets"""
+    from problem2_contractionHierarchies import ContractionHierarchy
+
+    side = 40 * scale
+    graph = grid_graph(side, side)
+    rng = random.Random(4)
+    labels = list(graph)
+    sources = rng.sample(labels, num_sources)
+    targets = rng.sample(labels, num_targets)
+    hierarchy = ContractionHierarchy.build(graph)
+
+    def per_source():
+        return {source: dijkstra(graph, source)[0] for source in sources}
+
+    rows = [
+        ("dijkstra per source", time_call(per_source, repeat=1)),
+        ("distance_table", time_call(distance_table, graph, sources, targets, repeat=1)),
+        ("CH many_to_many (buckets)", time_call(hierarchy.many_to_many, sources, targets, repeat=1)),
+    ]
+    print_results(f"{num_sources}x{num_targets} distance table on a {side}x{side} grid", rows)
+
+def benchmark_k_shortest_paths(k=10, num_queries=10, scale=1):
+    """Yen's k shortest paths versus the cost of k separate point-to-point searches"""
+    from problem2_kShortestPaths import k_shortest_paths
+
+    side = 60 * scale
+    graph = road_graph(side, side)
+    reverse_graph = build_reverse_graph(graph)
+    rng = random.Random(5)
+    labels = list(graph)
+    queries = [(rng.choice(labels), rng.choice(labels)) for _ in range(num_queries)]
+
+    def single_searches():
+        for start, end in queries:
+            for _ in range(k):
+                shortest_path(graph, start, end, reverse_graph=reverse_graph)
+
+    def yen(count):
+        for start, end in queries:
+            k_shortest_paths(graph, start, end, count, reverse_graph)
+
+    rows = [
+        (f"{k} x bidirectional search", time_call(single_searches, repeat=1)),
+        ("k_shortest_paths k=1", time_call(yen, 1, repeat=1)),
+        (f"k_shortest_paths k={k}", time_call(yen, k, repeat=1)),
+    ]
+    print_results(f"{num_queries} alternative-route queries on a {side}x{side} road graph", rows)
+
+def benchmark_parallel(num_sources=64, scale=1):
+    """Many-sources distance matrix throughput for increasing process counts"""
+    from problem2_parallel import many_sources_distances
+
+    num_nodes = 5000 * scale
+    graph = CSRGraph.from_dict(random_graph(num_nodes, 4 * num_nodes))
+    sources = graph.labels[:num_sources]
+    counts = sorted({1, 2, os.cpu_count() or 1})
+    rows = [(f"{count} process(es)", time_call(many_sources_distances, graph, sources, processes=count, repeat=1))
+            for count in counts]
+    print_results(f"{num_sources} sources x {num_nodes} targets distance matrix", rows)
+
+def benchmark_delta_stepping(scale=1):
+    """Serial dijkstra versus delta-stepping with one process and with every core"""
+    from problem2_deltaStepping import DeltaSteppingSolver
+
+    num_nodes = 100000 * scale
+    graph = CSRGraph.from_dict(random_graph(num_nodes, 4 * num_nodes))
+    rows = [("dijkstra (CSR)", time_call(dijkstra, graph, "N0", repeat=1))]
+    for processes in sorted({1, os.cpu_count() or 1}):
+        with DeltaSteppingSolver(graph, processes=processes) as solver:
+            rows.append((f"delta-stepping {processes} proc", time_call(solver.solve, 0, repeat=1)))
+    print_results(f"Single-source on a low-diameter random graph ({num_nodes} nodes, {4 * num_nodes} edges)", rows)
+
+def benchmark_vectorized(scale=1):
+    """dijkstra_csr versus the NumPy frontier engine on a random graph and a road-like grid"""
+    from problem2_vectorized import HAVE_NUMPY, VectorizedGraph, vectorized_sssp
+
+    if not HAVE_NUMPY:
+        print("\nVectorized engine skipped: NumPy is not installed")
+        return
+    num_nodes = 100000 * scale
+    side = int(num_nodes ** 0.5)
+    for title, graph in ((f"random ({num_nodes} nodes, {4 * num_nodes} edges)", random_graph(num_nodes, 4 * num_nodes)),
+                         (f"road-like grid ({side}x{side})", road_graph(side, side))):
+        graph = CSRGraph.from_dict(graph)
+        vgraph = VectorizedGraph(graph)
+        rows = [
+            ("dijkstra_csr", time_call(dijkstra_csr, graph, 0, repeat=1)),
+            ("vectorized (NumPy)", time_call(vectorized_sssp, vgraph, 0, repeat=1)),
+        ]
+        print_results(f"Single-source on a {title}", rows)
+
+def benchmark_workspace(num_queries=2000, scale=1):
+    """Fresh per-query arrays versus a reused SearchWorkspace for short early-exit queries"""
+    num_nodes = 200000 * scale
+    graph = CSRGraph.from_dict(road_graph(int(num_nodes ** 0.5), int(num_nodes ** 0.5)))
+    rng = random.Random(0)
+    # Nearby pairs (a short random walk apart): each search settles a small region of a large graph
+    queries = []
+    for _ in range(num_queries):
+        source = target = rng.randrange(graph.num_nodes)
+        for _ in range(5):
+            out_edges = list(graph.neighbors(target))
+            if out_edges:
+                target = rng.choice(out_edges)[0]
+        queries.append((source, target))
+    workspace = SearchWorkspace(graph)
+
+    def fresh():
+        for source, target in queries:
+            dijkstra_csr(graph, source, target=target)
+
+    def reused():
+        for source, target in queries:
+            workspace.search(source, target)
+
+    rows = [
+        ("dijkstra_csr (new arrays)", time_call(fresh, repeat=1)),
+        ("SearchWorkspace (reused)", time_call(reused, repeat=1)),
+    ]
+    print_results(f"{num_queries} local queries on a {graph.num_nodes}-node road-like grid", rows)
+
+def benchmark_reachability(num_queries=200, scale=1):
+    """Point-to-point queries with and without a ReachabilityIndex on a graph of one-way linked districts"""
+    # Strongly connected districts joined in a chain by one-way edges: about half of all pairs are unreachable
+    num_districts, district_nodes = 8, 2500 * scale
+    graph = {}
+    for d in range(num_districts):
+        district = random_graph(district_nodes, 4 * district_nodes, seed=d)
+        graph.update({f"D{d}{u}": {f"D{d}{v}": w for v, w in neighbors.items()} for u, neighbors in district.items()})
+        if d:
+            graph[f"D{d - 1}N0"][f"D{d}N0"] = 1
+    graph = CSRGraph.from_dict(graph)
+    reverse_graph = graph.reverse()
+    rng = random.Random(1)
+    queries = [(rng.choice(graph.labels), rng.choice(graph.labels)) for _ in range(num_queries)]
+    index = ReachabilityIndex(graph)
+    unreachable = sum(not index.reachable(start, end) for start, end in queries)
+
+    def run(method, reachability=None):
+        for start, end in queries:
+            shortest_path(graph, start, end, method=method, reverse_graph=reverse_graph, reachability=reachability)
+
+    rows = [
+        ("early exit", time_call(run, 'dijkstra', repeat=1)),
+        ("early exit + index", time_call(run, 'dijkstra', index, repeat=1)),
+        ("bidirectional", time_call(run, 'bidirectional', repeat=1)),
+        ("bidirectional + index", time_call(run, 'bidirectional', index, repeat=1)),
+    ]
+    print_results(f"{num_queries} queries ({unreachable} unreachable) over {graph.num_nodes} nodes; "
+                  f"index built in {index.build_seconds * 1000:.1f} ms", rows)
+
+def benchmark_loading(scale=1):
+    """csv.DictReader loader versus the chunked streaming loader"""
+    from problem2_graphLoader import stream_load_graph
+
+    num_nodes = 20000 * scale
+    graph = random_graph(num_nodes, 10 * num_nodes)
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, "edges.csv")
+        write_edge_csv(graph, filename)
+        rows = [
+            ("DictReader (dict of dicts)", time_call(load_graph_from_csv, filename, repeat=1)),
+            ("DictReader -> CSRGraph", time_call(load_graph_from_csv, filename, compact=True, repeat=1)),
+            ("streaming -> CSRGraph", time_call(stream_load_graph, filename, repeat=1)),
+        ]
+    print_results(f"Loading {10 * num_nodes} edges", rows)
+
+def benchmark_dynamic_updates(num_batches=20, batch_size=3, scale=1):
+    """Incremental repair versus recomputing from scratch after small batches of weight changes"""
+    from problem2_dynamicPaths import DynamicShortestPaths
+
+    num_nodes = 20000 * scale
+    base = random_graph(num_nodes, 4 * num_nodes)
+    rng = random.Random(1)
+    batches = []
+    for _ in range(num_batches):
+        batch = []
+        for _ in range(batch_size):
+            u = f"N{rng.randrange(num_nodes)}"
+            v = rng.choice(list(base[u]))
+            batch.append((u, v, rng.randint(1, 100)))
+        batches.append(batch)
+
+    def recompute():
+        graph = {node: dict(neighbors) for node, neighbors in base.items()}
+        for batch in batches:
+            for u, v, weight in batch:
+                graph[u][v] = weight
+            dijkstra(graph, "N0")
+
+    def repair():
+        paths = DynamicShortestPaths({node: dict(neighbors) for node, neighbors in base.items()}, "N0")
+        for batch in batches:
+            paths.apply_updates(batch)
+
+    # Both include the initial copy; repair additionally pays for one full search up front
+    rows = [
+        ("full dijkstra per batch", time_call(recompute, repeat=1)),
+        ("DynamicShortestPaths", time_call(repair, repeat=1)),
+    ]
+    print_results(f"{num_batches} batches of {batch_size} weight changes ({num_nodes} nodes)", rows)
+
+def main():
+    print("Dijkstra Benchmarks - CSC2103 Data Structures Assignment")
+    print("=" * 60)
+    benchmark_loading()
+    benchmark_heaps()
+    benchmark_integer_queues()
+    benchmark_heap_memory()
+    benchmark_point_to_point()
+    benchmark_workspace()
+    benchmark_goal_directed()
+    benchmark_reachability()
+    benchmark_contraction_hierarchies()
+    benchmark_many_to_many()
+    benchmark_k_shortest_paths()
+    benchmark_parallel()
+    benchmark_delta_stepping()
+    benchmark_vectorized()
+    benchmark_dynamic_updates()
+
+if __name__ == "__main__":
+    main()
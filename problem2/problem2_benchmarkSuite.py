@@ -0,0 +1,214 @@
+'''
+CSC2103 Data Structures and Algorithms
+Problem 2: Dijkstra's Algorithm - Benchmark Suite
+
+Runs every shortest path engine over families of synthetic graphs (grid, random
+sparse/dense, scale-free and road-like) from 10^3 edges upwards and records
+load time, single-source time, point-to-point time, peak memory and heap
+operation counts. Results are written as JSON together with the git commit they
+were measured on, so two runs can be compared side by side.
+
+Run from the problem2 directory:
+    python problem2_benchmarkSuite.py --max-edges 100000 --output results.json
+    python problem2_benchmarkSuite.py --compare baseline.json results.json
+'''
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from problem2_benchmark import (grid_graph, peak_memory, random_graph, road_graph, scale_free_graph, time_call,
+                                write_edge_csv)
+from problem2_dijkstra import CSRGraph, LandmarkIndex, SearchStats, dijkstra, load_graph_from_csv, shortest_path
+from problem2_graphLoader import stream_load_graph
+
+SUITE_VERSION = 1
+
+# Graph families; each builds a dict-of-dicts graph with roughly num_edges edges
+GENERATORS = {
+    'grid': lambda num_edges, seed: grid_graph(*(2 * [max(2, round((num_edges / 4) ** 0.5))]), seed=seed),
+    'random-sparse': lambda num_edges, seed: random_graph(max(2, num_edges // 4), num_edges, seed=seed),
+    'random-dense': lambda num_edges, seed: random_graph(max(4, round((10 * num_edges) ** 0.5)), num_edges, seed=seed),
+    'scale-free': lambda num_edges, seed: scale_free_graph(max(4, num_edges // 4), 2, seed=seed),
+    'road': lambda num_edges, seed: road_graph(*(2 * [max(2, round((num_edges / 3.7) ** 0.5))]), seed=seed),
+}
+
+# Single-source engines: (name, use CSRGraph, heap)
+SSSP_ENGINES = [
+    ("dict lazy", False, 'lazy'),
+    ("dict auto", False, 'auto'),
+    ("csr lazy", True, 'lazy'),
+    ("csr indexed", True, 'indexed'),
+    ("csr auto", True, 'auto'),
+]
+
+P2P_METHODS = ['dijkstra', 'bidirectional', 'alt']
+
+def git_commit():
+    """Short hash of the checked-out commit, or None outside a git repository"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+def run_case(generator, target_edges, num_queries=20, repeat=3, seed=0):
+    """Benchmark every engine on one generated graph; returns a list of result records"""
+    graph = GENERATORS[generator](target_edges, seed)
+    csr = CSRGraph.from_dict(graph)
+    records = []
+
+    def record(metric, engine, value, unit):
+        records.append({'generator': generator, 'target_edges': target_edges, 'nodes': csr.num_nodes,
+                        'edges': csr.num_edges, 'metric': metric, 'engine': engine, 'value': value, 'unit': unit})
+
+    # Loading from CSV
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, "edges.csv")
+        write_edge_csv(graph, filename)
+        loaders = [
+            ("DictReader dict", lambda: load_graph_from_csv(filename)),
+            ("DictReader csr", lambda: load_graph_from_csv(filename, compact=True)),
+            ("streaming csr", lambda: stream_load_graph(filename)),
+        ]
+        for name, loader in loaders:
+            record('load_time', name, time_call(loader, repeat=1), 's')
+            record('load_peak_memory', name, peak_memory(loader), 'bytes')
+
+    # Single-source shortest paths from a fixed start
+    start = csr.labels[0]
+    for name, compact, heap in SSSP_ENGINES:
+        target_graph = csr if compact else graph
+        record('sssp_time', name, time_call(dijkstra, target_graph, start, heap=heap, repeat=repeat), 's')
+        record('sssp_peak_memory', name, peak_memory(dijkstra, target_graph, start, heap=heap), 'bytes')
+        stats = SearchStats()
+        dijkstra(target_graph, start, heap=heap, stats=stats)
+        record('heap_pushes', name, stats.pushes, 'ops')
+        record('heap_pops', name, stats.pops, 'ops')
+        record('heap_stale_pops', name, stats.stale_pops, 'ops')
+        record('heap_peak_size', name, stats.peak_heap, 'entries')
+        record('edges_relaxed', name, stats.edges_relaxed, 'ops')
+
+    # Point-to-point queries between random node pairs
+    rng = random.Random(seed)
+    queries = [(rng.choice(csr.labels), rng.choice(csr.labels)) for _ in range(num_queries)]
+    landmarks = LandmarkIndex(csr)
+    reverse_graph = csr.reverse()
+    record('alt_preprocess_time', 'csr alt', landmarks.preprocess_seconds, 's')
+
+    def run_queries(method):
+        for source, target in queries:
+            shortest_path(csr, source, target, method=method, reverse_graph=reverse_graph, landmarks=landmarks)
+
+    for method in P2P_METHODS:
+        elapsed = time_call(run_queries, method, repeat=1)
+        record('p2p_time_per_query', f"csr {method}", elapsed / num_queries, 's')
+    return records
+
+def run_suite(generators=None, min_edges=10**3, max_edges=10**5, num_queries=20, repeat=3, seed=0):
+    """Run run_case for every generator and every power of ten between min_edges and max_edges"""
+    generators = generators or list(GENERATORS)
+    sizes = []
+    size = min_edges
+    while size <= max_edges:
+        sizes.append(size)
+        size *= 10
+
+    results = []
+    for target_edges in sizes:
+        for generator in generators:
+            start_time = time.perf_counter()
+            records = run_case(generator, target_edges, num_queries, repeat, seed)
+            results.extend(records)
+            print(f"{generator:<14} {target_edges:>10,} edges  done in {time.perf_counter() - start_time:.1f} s",
+                  file=sys.stderr)
+    return {
+        'suite_version': SUITE_VERSION,
+        'commit': git_commit(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+def _result_key(record):
+    return record['generator'], record['target_edges'], record['metric'], record['engine']
+
+def print_report(report):
+    """Print every result of one run grouped by graph"""
+    print(f"Benchmark suite v{report['suite_version']} at commit {report['commit'] or 'unknown'} "
+          f"(Python {report['python']}, {report['platform']})")
+    current = None
+    for record in report['results']:
+        graph = (record['generator'], record['target_edges'])
+        if graph != current:
+            current = graph
+            print(f"\n{record['generator']}: {record['nodes']:,} nodes, {record['edges']:,} edges")
+        value = record['value']
+        shown = f"{value * 1000:.3f} ms" if record['unit'] == 's' else f"{value:,} {record['unit']}"
+        print(f"  {record['metric']:<22}{record['engine']:<20}{shown:>20}")
+
+def compare_reports(old, new, threshold=0.10):
+    """Print new/old ratios for results present in both runs; ratios beyond threshold are flagged"""
+    old_results = {_result_key(record): record for record in old['results']}
+    print(f"Comparing {old['commit'] or 'unknown'} ({old['created']}) -> {new['commit'] or 'unknown'} ({new['created']})")
+    print(f"{'graph':<24}{'metric':<22}{'engine':<20}{'old':>14}{'new':>14}{'ratio':>8}")
+    for record in new['results']:
+        before = old_results.get(_result_key(record))
+        if before is None:
+            continue
+        if before['value']:
+            ratio = record['value'] / before['value']
+        else:
+            ratio = 1.0 if not record['value'] else float('inf')  # Zero in both runs is unchanged
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  worse"
+        elif ratio < 1 - threshold:
+            flag = "  better"
+        graph = f"{record['generator']}/{record['target_edges']:,}"
+        print(f"{graph:<24}{record['metric']:<22}{record['engine']:<20}"
+              f"{before['value']:>14.6g}{record['value']:>14.6g}{ratio:>8.2f}{flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Shortest path benchmark suite")
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), help="graph families (default: all)")
+    parser.add_argument('--min-edges', type=int, default=10**3)
+    parser.add_argument('--max-edges', type=int, default=10**5, help="up to 10**7 for the full range")
+    parser.add_argument('--queries', type=int, default=20, help="point-to-point queries per graph")
+    parser.add_argument('--repeat', type=int, default=3, help="best-of repeats for single-source timings")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', nargs='+', metavar='JSON',
+                        help="compare OLD against NEW (or against a fresh run when only OLD is given)")
+    args = parser.parse_args()
+
+    print("Shortest Path Benchmark Suite - CSC2103 Data Structures Assignment")
+    print("=" * 60)
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes one or two JSON files")
+    if args.compare and len(args.compare) == 2:
+        with open(args.compare[0], encoding='utf-8') as old_file, open(args.compare[1], encoding='utf-8') as new_file:
+            compare_reports(json.load(old_file), json.load(new_file))
+        return
+
+    report = run_suite(args.generators, args.min_edges, args.max_edges, args.queries, args.repeat, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=1)
+        print(f"Results written to {args.output}")
+    if args.compare:
+        with open(args.compare[0], encoding='utf-8') as old_file:
+            compare_reports(json.load(old_file), report)
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
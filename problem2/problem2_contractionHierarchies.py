@@ -0,0 +1,381 @@
+'''
+CSC2103 Data Structures and Algorithms
+Problem 2: Dijkstra's Algorithm - Contraction Hierarchies
+
+Contraction Hierarchies (CH) speed up repeated point-to-point queries on a graph
+that rarely changes. Preprocessing contracts nodes one at a time in order of
+importance, adding shortcut edges so that shortest distances between the
+remaining nodes are preserved. A query then runs a bidirectional Dijkstra that
+only follows edges towards more important nodes, and shortcuts are unpacked
+back into the original edges so callers get the same paths as reconstruct_path.
+
+The preprocessed hierarchy can be saved to disk and loaded on the next start.
+
+Run from the problem2 directory:  python problem2_contractionHierarchies.py
+'''
+
+import hashlib
+import json
+import os
+import struct
+import time
+from array import array
+
+from problem2_dijkstra import CSRGraph, DATA_PATH, MinHeap, dijkstra, load_graph_from_csv, reconstruct_path
+
+CH_MAGIC = b'CSC2103CH'
+CH_VERSION = 1
+
+def graph_fingerprint(graph):
+    """SHA-1 of a CSRGraph's labels and arrays, used to detect a stale saved hierarchy"""
+    digest = hashlib.sha1()
+    digest.update(json.dumps(graph.labels).encode('utf-8'))
+    for arr in (graph.offsets, graph.targets, graph.weights):
+        digest.update(arr.tobytes())
+    return digest.hexdigest()
+
+class ContractionHierarchy:
+    """
+    Augmented "upward" graph produced by contraction.
+    up_*[u] holds edges u -> v with rank[v] > rank[u]; down_*[v] holds edges
+    x -> v with rank[x] > rank[v], stored at v so the backward search can follow
+    them in reverse. middles[e] is the contracted node a shortcut bypasses (-1 for
+    an original edge). Both halves are stored in CSR form with typed arrays.
+    """
+
+    def __init__(self, labels, rank, up, down, fingerprint=''):
+        self.labels = list(labels)
+        self.index = {label: i for i, label in enumerate(self.labels)}
+        self.rank = rank
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middles = up
+        self.down_offsets, self.down_targets, self.down_weights, self.down_middles = down
+        self.fingerprint = fingerprint
+        self.preprocess_seconds = 0.0
+        self.num_shortcuts = sum(1 for m in self.up_middles if m >= 0) + sum(1 for m in self.down_middles if m >= 0)
+
+    @classmethod
+    def build(cls, graph, witness_settle_limit=500, simulate_settle_limit=60):
+        """Contract every node of graph (dict of dicts or CSRGraph) and return the hierarchy"""
+        start_time = time.perf_counter()
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        n = graph.num_nodes
+
+        # Working adjacency over the not-yet-contracted nodes: out[u][v] = (weight, middle)
+        out = [{} for _ in range(n)]
+        inn = [{} for _ in range(n)]
+        for u in range(n):
+            for v, weight in graph.neighbors(u):
+                if u != v and (v not in out[u] or weight < out[u][v][0]):
+                    out[u][v] = (weight, -1)
+                    inn[v][u] = (weight, -1)
+
+        contracted = [False] * n
+        deleted_neighbors = [0] * n
+        rank = array('q', [0]) * n
+        up_edges = [None] * n     # Edges leaving u towards higher ranks, fixed when u is contracted
+        down_edges = [None] * n   # Edges entering v from higher ranks
+
+        def needed_shortcuts(u, settle_limit):
+            # Shortcuts x -> y through u that have no witness path avoiding u
+            shortcuts = []
+            if not inn[u] or not out[u]:
+                return shortcuts
+            max_out = max(weight for weight, _ in out[u].values())
+            for x, (w_in, _) in inn[u].items():
+                witness = _witness_search(out, x, u, w_in + max_out, settle_limit)
+                for y, (w_out, _) in out[u].items():
+                    if y == x:
+                        continue
+                    via = w_in + w_out
+                    if witness.get(y, float('inf')) > via:
+                        shortcuts.append((x, y, via))
+            return shortcuts
+
+        def priority(u):
+            # Edge difference plus number of already contracted neighbours
+            added = len(needed_shortcuts(u, simulate_settle_limit))
+            return added - len(inn[u]) - len(out[u]) + deleted_neighbors[u]
+
+        heap = MinHeap()
+        for u in range(n):
+            heap.push((priority(u), u))
+
+        next_rank = 0
+        while len(heap):
+            _, u = heap.pop()
+            if contracted[u]:
+                continue
+            # Lazy update: re-queue if the node became more expensive than the next candidate
+            current = priority(u)
+            if len(heap) and current > heap.data[0][0]:
+                heap.push((current, u))
+                continue
+
+            for x, y, via in needed_shortcuts(u, witness_settle_limit):
+                if y not in out[x] or via < out[x][y][0]:
+                    out[x][y] = (via, u)
+                    inn[y][x] = (via, u)
+
+            up_edges[u] = list(out[u].items())
+            down_edges[u] = list(inn[u].items())
+            for x in inn[u]:
+                del out[x][u]
+                deleted_neighbors[x] += 1
+            for y in out[u]:
+                del inn[y][u]
+                deleted_neighbors[y] += 1
+            out[u] = {}
+            inn[u] = {}
+            contracted[u] = True
+            rank[u] = next_rank
+            next_rank += 1
+
+        typecode = graph.weight_typecode
+        hierarchy = cls(graph.labels, rank, _pack_edges(up_edges, typecode), _pack_edges(down_edges, typecode),
+                        graph_fingerprint(graph))
+        hierarchy.preprocess_seconds = time.perf_counter() - start_time
+        return hierarchy
+
+    def query(self, start, end):
+        """Shortest (distance, path) between two labels; (inf, []) when unreachable"""
+        s, t = self.index[start], self.index[end]
+        distance, path = self.query_ids(s, t)
+        return distance, [self.labels[u] for u in path]
+
+    def query_ids(self, s, t):
+        """Bidirectional upward search between node IDs, with shortcuts unpacked in the path"""
+        if s == t:
+            return 0, [s]
+        sides = (
+            (self.up_offsets, self.up_targets, self.up_weights, self.up_middles),
+            (self.down_offsets, self.down_targets, self.down_weights, self.down_middles),
+        )
+        dist = ({s: 0}, {t: 0})
+        prev = ({s: None}, {t: None})   # node -> (previous node, middle of the edge used)
+        heaps = (MinHeap(), MinHeap())
+        heaps[0].push((0, s))
+        heaps[1].push((0, t))
+
+        best = float('inf')
+        meeting = -1
+        while len(heaps[0]) or len(heaps[1]):
+            # Each direction stops once its frontier can no longer improve best
+            for side in (0, 1):
+                heap = heaps[side]
+                if not len(heap):
+                    continue
+                if heap.data[0][0] >= best:
+                    heap.data.clear()
+                    continue
+                current_dist, u = heap.pop()
+                if current_dist > dist[side][u]:
+                    continue
+                if u in dist[1 - side] and current_dist + dist[1 - side][u] < best:
+                    best = current_dist + dist[1 - side][u]
+                    meeting = u
+                offsets, targets, weights, middles = sides[side]
+                for e in range(offsets[u], offsets[u + 1]):
+                    v = targets[e]
+                    alt = current_dist + weights[e]
+                    if alt < dist[side].get(v, float('inf')):
+                        dist[side][v] = alt
+                        prev[side][v] = (u, middles[e])
+                        heap.push((alt, v))
+
+        if meeting < 0:
+            return float('inf'), []
+
+        # Collect the hierarchy edges s .. meeting .. t, then unpack shortcuts
+        edges = []
+        node = meeting
+        while prev[0][node] is not None:
+            parent, middle = prev[0][node]
+            edges.append((parent, node, middle))
+            node = parent
+        edges.reverse()
+        node = meeting
+        while prev[1][node] is not None:
+            child, middle = prev[1][node]
+            edges.append((node, child, middle))
+            node = child
+
+        path = [s]
+        for u, v, middle in edges:
+            path.extend(self._unpack(u, v, middle))
+        return best, path
+
+    def many_to_many(self, sources, targets):
+        """
+        Distance table[source][target] between two label lists (inf when unreachable).
+        One backward upward search per target leaves (target, distance) entries in
+        per-node buckets; one forward upward search per source then combines with
+        the buckets it meets, so the table costs N + M small searches instead of N full ones.
+        """
+        target_ids = [self.index[label] for label in targets]
+        buckets = {}
+        for j, t in enumerate(target_ids):
+            for node, distance in self._upward_search(self.down_offsets, self.down_targets, self.down_weights, t).items():
+                buckets.setdefault(node, []).append((j, distance))
+
+        table = {}
+        for source in sources:
+            row = [float('inf')] * len(target_ids)
+            reached = self._upward_search(self.up_offsets, self.up_targets, self.up_weights, self.index[source])
+            for node, distance in reached.items():
+                for j, to_target in buckets.get(node, ()):
+                    if distance + to_target < row[j]:
+                        row[j] = distance + to_target
+            table[source] = dict(zip(targets, row))
+        return table
+
+    @staticmethod
+    def _upward_search(offsets, targets, weights, start):
+        # Exhaustive Dijkstra over one half of the hierarchy; returns node -> distance
+        dist = {start: 0}
+        heap = MinHeap()
+        heap.push((0, start))
+        while len(heap):
+            current_dist, u = heap.pop()
+            if current_dist > dist[u]:
+                continue
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                alt = current_dist + weights[e]
+                if alt < dist.get(v, float('inf')):
+                    dist[v] = alt
+                    heap.push((alt, v))
+        return dist
+
+    def _unpack(self, u, v, middle):
+        # Original nodes after u on the edge u -> v, expanding nested shortcuts
+        result = []
+        stack = [(u, v, middle)]
+        while stack:
+            a, b, m = stack.pop()
+            if m < 0:
+                result.append(b)
+                continue
+            # a -> m is stored at m as a down edge, m -> b as an up edge
+            stack.append((m, b, self._middle_of(self.up_offsets, self.up_targets, self.up_middles, m, b)))
+            stack.append((a, m, self._middle_of(self.down_offsets, self.down_targets, self.down_middles, m, a)))
+        return result
+
+    @staticmethod
+    def _middle_of(offsets, targets, middles, owner, other):
+        for e in range(offsets[owner], offsets[owner + 1]):
+            if targets[e] == other:
+                return middles[e]
+        raise KeyError(f"hierarchy edge {owner} <-> {other} is missing")
+
+    def save(self, filename):
+        """Write the hierarchy to a binary file"""
+        labels = json.dumps(self.labels).encode('utf-8')
+        fingerprint = self.fingerprint.encode('ascii')
+        arrays = (self.rank, self.up_offsets, self.up_targets, self.up_weights, self.up_middles,
+                  self.down_offsets, self.down_targets, self.down_weights, self.down_middles)
+        with open(filename, 'wb') as file:
+            file.write(CH_MAGIC)
+            file.write(struct.pack('<HcQQQ', CH_VERSION, self.up_weights.typecode.encode('ascii'),
+                                   len(self.labels), len(self.up_targets), len(self.down_targets)))
+            file.write(struct.pack('<I', len(fingerprint)) + fingerprint)
+            file.write(struct.pack('<Q', len(labels)) + labels)
+            for arr in arrays:
+                arr.tofile(file)
+
+    @classmethod
+    def load(cls, filename):
+        """Read a hierarchy written by save()"""
+        with open(filename, 'rb') as file:
+            if file.read(len(CH_MAGIC)) != CH_MAGIC:
+                raise ValueError(f"{filename} is not a contraction hierarchy file")
+            version, typecode, n, num_up, num_down = struct.unpack('<HcQQQ', file.read(struct.calcsize('<HcQQQ')))
+            if version != CH_VERSION:
+                raise ValueError(f"Unsupported contraction hierarchy version {version}")
+            typecode = typecode.decode('ascii')
+            (fp_len,) = struct.unpack('<I', file.read(4))
+            fingerprint = file.read(fp_len).decode('ascii')
+            (labels_len,) = struct.unpack('<Q', file.read(8))
+            labels = json.loads(file.read(labels_len).decode('utf-8'))
+
+            def read(code, count):
+                arr = array(code)
+                arr.fromfile(file, count)
+                return arr
+
+            rank = read('q', n)
+            up = (read('q', n + 1), read('q', num_up), read(typecode, num_up), read('q', num_up))
+            down = (read('q', n + 1), read('q', num_down), read(typecode, num_down), read('q', num_down))
+        return cls(labels, rank, up, down, fingerprint)
+
+    @classmethod
+    def load_or_build(cls, graph, filename, **build_options):
+        """Load a saved hierarchy when it matches graph, otherwise build and save a new one"""
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        if os.path.exists(filename):
+            try:
+                hierarchy = cls.load(filename)
+                if hierarchy.fingerprint == graph_fingerprint(graph):
+                    return hierarchy
+            except (OSError, ValueError, EOFError, struct.error):
+                pass  # Corrupt or outdated file, rebuild below
+        hierarchy = cls.build(graph, **build_options)
+        hierarchy.save(filename)
+        return hierarchy
+
+def _witness_search(out, source, skip, max_dist, settle_limit):
+    # Bounded Dijkstra from source that ignores node skip
+    dist = {source: 0}
+    heap = MinHeap()
+    heap.push((0, source))
+    settled = 0
+    while len(heap) and settled < settle_limit:
+        current_dist, u = heap.pop()
+        if current_dist > dist[u]:
+            continue
+        if current_dist > max_dist:
+            break
+        settled += 1
+        for v, (weight, _) in out[u].items():
+            if v == skip:
+                continue
+            alt = current_dist + weight
+            if alt < dist.get(v, float('inf')):
+                dist[v] = alt
+                heap.push((alt, v))
+    return dist
+
+def _pack_edges(edge_lists, typecode):
+    # Per-node [(neighbor, (weight, middle))] lists -> CSR arrays
+    offsets = array('q', [0])
+    targets = array('q')
+    weights = array(typecode)
+    middles = array('q')
+    for edges in edge_lists:
+        for v, (weight, middle) in edges:
+            targets.append(v)
+            weights.append(weight)
+            middles.append(middle)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middles
+
+def main():
+    print("Contraction Hierarchies - CSC2103 Data Structures Assignment")
+    print("=" * 60)
+    graph = load_graph_from_csv(DATA_PATH)
+    cache_path = os.path.splitext(DATA_PATH)[0] + ".ch"
+    hierarchy = ContractionHierarchy.load_or_build(graph, cache_path)
+    print(f"Hierarchy ready: {len(hierarchy.labels)} nodes, {hierarchy.num_shortcuts} shortcut(s), cached at {cache_path}")
+
+    for start in sorted(graph):
+        dist, prev = dijkstra(graph, start)
+        for end in sorted(graph):
+            distance, path = hierarchy.query(start, end)
+            expected = reconstruct_path(prev, start, end) if dist[end] != float('inf') else []
+            status = "✓" if distance == dist[end] else "✗"
+            path_str = ' → '.join(path) if path else "No path"
+            print(f"{status} {start} → {end}: {distance} ({path_str})" + ("" if path == expected else f" [dijkstra: {expected}]"))
+
+if __name__ == "__main__":
+    main()
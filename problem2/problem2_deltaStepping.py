@@ -0,0 +1,171 @@
+'''
+CSC2103 Data Structures and Algorithms
+Problem 2: Dijkstra's Algorithm - Parallel Delta-Stepping
+
+Delta-stepping (Meyer and Sanders) replaces Dijkstra's one-node-at-a-time
+priority queue with buckets of width delta. All nodes in the lowest non-empty
+bucket are expanded together: their light edges (weight <= delta) are relaxed
+repeatedly until the bucket stays empty, then their heavy edges once. Every
+round is a batch of independent relaxations, so large frontiers are split into
+chunks and relaxed by a process pool.
+
+Workers read the tentative distances from a shared-memory array and return
+only the improvements they found; the parent applies them, so every distance
+is exactly the minimum over the same sums dijkstra computes and the results
+match dijkstra. Tied predecessors may differ. Small frontiers are relaxed in the
+parent, where a round trip to the pool would cost more than it saves.
+
+Run from the problem2 directory:  python problem2_deltaStepping.py
+'''
+
+import multiprocessing
+import os
+import time
+from array import array
+
+from problem2_dijkstra import CSRGraph, DATA_PATH, dijkstra_csr, load_graph_from_csv
+from problem2_parallel import make_graph_pool, release_worker_state, worker_state
+
+def _relax_nodes(graph, dist, nodes, light, delta):
+    # Best improving (v, distance, u) per target for the light or heavy out-edges of nodes
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    best = {}
+    for u in nodes:
+        du = dist[u]
+        for e in range(offsets[u], offsets[u + 1]):
+            weight = weights[e]
+            if (weight <= delta) != light:
+                continue
+            v = targets[e]
+            alt = du + weight
+            if alt < dist[v] and (v not in best or alt < best[v][0]):
+                best[v] = (alt, u)
+    return [(v, alt, u) for v, (alt, u) in best.items()]
+
+def _relax_chunk(task):
+    # Worker task over the shared graph and distance array
+    nodes, light, delta = task
+    state = worker_state()
+    return _relax_nodes(state['graph'], state['dist'], nodes, light, delta)
+
+def default_delta(graph):
+    """Bucket width of about max_weight / average out-degree, a common starting point"""
+    if graph.num_edges == 0:
+        return 1
+    return max(1, graph.max_weight * graph.num_nodes / graph.num_edges)
+
+class DeltaSteppingSolver:
+    """
+    Reusable delta-stepping engine over one CSRGraph.
+    The shared distance array and the worker pool are created once and reused by
+    every solve(); call close() (or use a with block) to stop the workers.
+    Frontiers smaller than min_parallel nodes are relaxed in the calling process.
+    """
+
+    def __init__(self, graph, delta=None, processes=None, min_parallel=2048):
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        if delta is not None and delta <= 0:
+            raise ValueError('delta must be positive')
+        self.graph = graph
+        self.delta = delta or default_delta(graph)
+        self.processes = processes or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        self.dist = multiprocessing.RawArray('d', graph.num_nodes)
+        self.rounds = 0
+        self.parallel_rounds = 0
+        self.pool = None
+        if self.processes > 1:
+            self.pool = make_graph_pool(graph, self.processes, dist=self.dist)
+
+    def _relax(self, nodes, light):
+        if self.pool is None or len(nodes) < self.min_parallel:
+            return _relax_nodes(self.graph, self.dist, nodes, light, self.delta)
+        self.parallel_rounds += 1
+        size = -(-len(nodes) // (self.processes * 4))
+        tasks = [(nodes[i:i + size], light, self.delta) for i in range(0, len(nodes), size)]
+        improvements = []
+        for chunk in self.pool.map(_relax_chunk, tasks):
+            improvements.extend(chunk)
+        return improvements
+
+    def solve(self, source):
+        """Single-source distances and predecessors by node ID (lists, like dijkstra_csr)"""
+        n = self.graph.num_nodes
+        dist = self.dist
+        dist[:] = array('d', [float('inf')]) * n
+        prev = [-1] * n
+        delta = self.delta
+        dist[source] = 0
+        buckets = {0: {source}}
+
+        while buckets:
+            index = min(buckets)
+            settled = []
+            # Light edges can put nodes back into the current bucket, so repeat until it stays empty
+            while buckets.get(index):
+                frontier = list(buckets.pop(index))
+                settled.extend(frontier)
+                self._apply(self._relax(frontier, True), buckets, prev)
+                self.rounds += 1
+            buckets.pop(index, None)
+            self._apply(self._relax(settled, False), buckets, prev)
+            self.rounds += 1
+
+        result = list(dist)
+        if self.graph.integer_weights:
+            result = [int(d) if d != float('inf') else d for d in result]
+        return result, prev
+
+    def _apply(self, improvements, buckets, prev):
+        # Parent-side write of worker results; chunks may propose different values for one node
+        dist, delta = self.dist, self.delta
+        for v, alt, u in improvements:
+            old = dist[v]
+            if alt < old:
+                if old != float('inf'):
+                    old_bucket = buckets.get(int(old // delta))
+                    if old_bucket is not None:
+                        old_bucket.discard(v)
+                dist[v] = alt
+                prev[v] = u
+                buckets.setdefault(int(alt // delta), set()).add(v)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            release_worker_state()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def delta_stepping(graph, start, delta=None, processes=None):
+    """
+    Single-source shortest paths by parallel delta-stepping; returns (dist, prev)
+    keyed by label like dijkstra. For many queries keep a DeltaSteppingSolver open.
+    """
+    with DeltaSteppingSolver(graph, delta, processes) as solver:
+        dist, prev = solver.solve(solver.graph.index[start])
+        return solver.graph.node_map(dist), solver.graph.node_map(prev, ids=True)
+
+def main():
+    print("Parallel Delta-Stepping - CSC2103 Data Structures Assignment")
+    print("=" * 60)
+    graph = CSRGraph.from_dict(load_graph_from_csv(DATA_PATH))
+    with DeltaSteppingSolver(graph, processes=os.cpu_count() or 1) as solver:
+        for source, label in enumerate(graph.labels):
+            start_time = time.perf_counter()
+            dist, _ = solver.solve(source)
+            elapsed = time.perf_counter() - start_time
+            expected, _ = dijkstra_csr(graph, source)
+            status = "✓" if dist == expected else "✗"
+            cells = ", ".join(f"{graph.labels[v]}={'∞' if d == float('inf') else d}" for v, d in enumerate(dist))
+            print(f"{status} from {label}: {cells} ({elapsed * 1000:.2f} ms, delta {solver.delta:g})")
+
+if __name__ == "__main__":
+    main()
@@ -13,14 +13,25 @@ for users to explore the algorithm's behavior.
 
 # Custom Min Heap implementation
 import csv
+import hashlib
+import json
+import mmap
 import os
+import random
+import struct
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
 
 # Data source path definition
 DATA_PATH = os.path.join(os.path.dirname(__file__), "graph_edges.csv")
 
 class MinHeap:
-    def __init__(self):
+    def __init__(self, arity=2):
         self.data = []
+        self.arity = arity  # Children per node (2 = binary heap)
     
     def push(self, item):
         self.data.append(item)
@@ -35,24 +46,30 @@ class MinHeap:
         return item
     
     def _siftup(self, idx):
+        data = self.data
+        key = data[idx][0]
         while idx > 0:
-            parent = (idx - 1) // 2
-            if self.data[parent][0] > self.data[idx][0]:
+            parent = (idx - 1) // self.arity
+            if data[parent][0] > key:
                 self._swap(parent, idx)
                 idx = parent
             else:
                 break
 
     def _siftdown(self, idx):
-        n = len(self.data)
+        data = self.data
+        n = len(data)
+        arity = self.arity
         while True:
-            left = 2 * idx + 1
-            right = 2 * idx + 2
+            first = arity * idx + 1
+            if first >= n:
+                break
             smallest = idx
-            if left < n and self.data[left][0] < self.data[smallest][0]:
-                smallest = left
-            if right < n and self.data[right][0] < self.data[smallest][0]:
-                smallest = right
+            smallest_key = data[idx][0]
+            for child in range(first, min(first + arity, n)):
+                if data[child][0] < smallest_key:
+                    smallest = child
+                    smallest_key = data[child][0]
             if smallest != idx:
                 self._swap(idx, smallest)
                 idx = smallest
@@ -65,81 +82,957 @@ class MinHeap:
     def __len__(self):
         return len(self.data)
 
+class IndexedMinHeap:
+    """
+    d-ary min heap with a position map and a true decrease_key.
+    Each node appears at most once, so the heap never holds more than V entries
+    and no stale entries are popped. Priorities and nodes are kept in two
+    parallel lists to avoid re-indexing tuples during sifts.
+    """
+
+    def __init__(self, arity=2):
+        self.keys = []       # Priorities
+        self.nodes = []      # Node stored at each heap slot
+        self.position = {}   # node -> heap slot
+        self.arity = arity
+
+    def push(self, item):
+        """Insert (priority, node), or lower the priority of a queued node; returns True if the heap changed"""
+        priority, node = item
+        idx = self.position.get(node)
+        if idx is None:
+            self.keys.append(priority)
+            self.nodes.append(node)
+            self.position[node] = len(self.nodes) - 1
+            self._siftup(len(self.nodes) - 1)
+            return True
+        if priority < self.keys[idx]:
+            self.keys[idx] = priority
+            self._siftup(idx)
+            return True
+        return False
+
+    def decrease_key(self, node, priority):
+        """Lower the priority of a node already in the heap"""
+        idx = self.position[node]
+        if priority > self.keys[idx]:
+            raise ValueError('new priority is greater than current priority')
+        self.keys[idx] = priority
+        self._siftup(idx)
+
+    def pop(self):
+        if not self.nodes:
+            raise IndexError('pop from empty heap')
+        keys, nodes = self.keys, self.nodes
+        top_key, top_node = keys[0], nodes[0]
+        del self.position[top_node]
+        last_key, last_node = keys.pop(), nodes.pop()
+        if nodes:
+            keys[0] = last_key
+            nodes[0] = last_node
+            self.position[last_node] = 0
+            self._siftdown(0)
+        return top_key, top_node
+
+    def priority(self, node):
+        return self.keys[self.position[node]]
+
+    def _siftup(self, idx):
+        # Move the entry at idx up by shifting larger parents down into the hole
+        keys, nodes, position, arity = self.keys, self.nodes, self.position, self.arity
+        key, node = keys[idx], nodes[idx]
+        while idx > 0:
+            parent = (idx - 1) // arity
+            if keys[parent] <= key:
+                break
+            keys[idx] = keys[parent]
+            nodes[idx] = nodes[parent]
+            position[nodes[idx]] = idx
+            idx = parent
+        keys[idx] = key
+        nodes[idx] = node
+        position[node] = idx
+
+    def _siftdown(self, idx):
+        # Move the entry at idx down by pulling the smallest child up into the hole
+        keys, nodes, position, arity = self.keys, self.nodes, self.position, self.arity
+        n = len(keys)
+        key, node = keys[idx], nodes[idx]
+        while True:
+            first = arity * idx + 1
+            if first >= n:
+                break
+            smallest = first
+            smallest_key = keys[first]
+            for child in range(first + 1, min(first + arity, n)):
+                if keys[child] < smallest_key:
+                    smallest = child
+                    smallest_key = keys[child]
+            if smallest_key >= key:
+                break
+            keys[idx] = smallest_key
+            nodes[idx] = nodes[smallest]
+            position[nodes[idx]] = idx
+            idx = smallest
+        keys[idx] = key
+        nodes[idx] = node
+        position[node] = idx
+
+    def __contains__(self, node):
+        return node in self.position
+
+    def __len__(self):
+        return len(self.nodes)
+
+class CompactingHeap(MinHeap):
+    """
+    Lazy-deletion MinHeap that bounds its own size.
+    It remembers the live priority of every queued node, so a push that improves
+    a node turns the older entry stale and a push that does not improve is
+    ignored. Stale entries are skipped inside pop(), and once they make up more
+    than compact_ratio of the list (and the list has at least min_compact
+    entries) the list is filtered and re-heapified, keeping it at O(V) entries
+    instead of O(E) on dense graphs.
+    """
+
+    def __init__(self, arity=2, compact_ratio=0.5, min_compact=1024):
+        super().__init__(arity)
+        self.live = {}          # node -> priority of its only live entry
+        self.stale = 0
+        self.compact_ratio = compact_ratio
+        self.min_compact = min_compact
+        self.compactions = 0
+        self.peak_entries = 0   # Largest length the entry list reached
+
+    def push(self, item):
+        priority, node = item
+        old = self.live.get(node)
+        if old is not None:
+            if priority >= old:
+                return False
+            self.stale += 1
+        self.live[node] = priority
+        super().push(item)
+        if len(self.data) > self.peak_entries:
+            self.peak_entries = len(self.data)
+        if self.stale > self.compact_ratio * len(self.data) and len(self.data) >= self.min_compact:
+            self.compact()
+        return True
+
+    def pop(self):
+        if not self.live:
+            raise IndexError('pop from empty heap')
+        while True:
+            priority, node = super().pop()
+            if self.live.get(node) == priority:
+                del self.live[node]
+                return priority, node
+            self.stale -= 1
+
+    def compact(self):
+        """Drop every stale entry and restore the heap order bottom-up"""
+        live = self.live
+        self.data = [entry for entry in self.data if live.get(entry[1]) == entry[0]]
+        for idx in reversed(range((len(self.data) - 2) // self.arity + 1)):
+            self._siftdown(idx)
+        self.stale = 0
+        self.compactions += 1
+
+    def __len__(self):
+        return len(self.live)
+
+class BucketQueue:
+    """
+    Dial's bucket queue for non-negative integer priorities.
+    While Dijkstra runs every queued priority lies in [current, current + max_weight],
+    so max_weight + 1 circular buckets indexed by priority modulo their count are
+    enough. Push is O(1) and all pops together cost O(V * max_weight) bucket scans.
+    Like MinHeap it keeps stale entries; priorities must never go below the last pop.
+    """
+
+    def __init__(self, max_weight):
+        self.size = int(max_weight) + 1
+        self.buckets = [[] for _ in range(self.size)]
+        self.current = 0   # Priority of the bucket under the cursor
+        self.count = 0
+
+    def push(self, item):
+        priority, node = item
+        self.buckets[priority % self.size].append(node)
+        self.count += 1
+
+    def pop(self):
+        if not self.count:
+            raise IndexError('pop from empty heap')
+        buckets, size = self.buckets, self.size
+        bucket = buckets[self.current % size]
+        while not bucket:
+            self.current += 1
+            bucket = buckets[self.current % size]
+        self.count -= 1
+        return self.current, bucket.pop()
+
+    def __len__(self):
+        return self.count
+
+class RadixHeap:
+    """
+    Monotone radix heap for non-negative integer priorities.
+    An entry with priority p sits in bucket (p XOR last).bit_length(), where last is
+    the most recently popped priority. Refilling bucket 0 redistributes one bucket
+    into strictly lower ones, so each entry moves at most log2(C) times for a
+    maximum edge weight C. Priorities must never go below the last pop.
+    """
+
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]
+        self.last = 0
+        self.count = 0
+
+    def push(self, item):
+        self.buckets[(item[0] ^ self.last).bit_length()].append(item)
+        self.count += 1
+
+    def pop(self):
+        if not self.count:
+            raise IndexError('pop from empty heap')
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            entries = buckets[i]
+            buckets[i] = []
+            last = self.last = min(entries, key=lambda entry: entry[0])[0]
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self.count -= 1
+        return buckets[0].pop()
+
+    def __len__(self):
+        return self.count
+
+HEAP_TYPES = {'lazy': MinHeap, 'indexed': IndexedMinHeap, 'compact': CompactingHeap, 'dial': BucketQueue,
+              'radix': RadixHeap}
+
+# Largest integer edge weight for which heap='auto' picks Dial's buckets over the radix heap
+DIAL_MAX_WEIGHT = 1000
+
+def make_heap(heap='lazy', arity=2, max_weight=None):
+    """
+    Create a priority queue for dijkstra: 'lazy' (MinHeap with stale entries), 'indexed'
+    (decrease-key), 'compact' (lazy with bounded stale entries), or for integer weights
+    'dial' (buckets, needs max_weight) and 'radix'.
+    A ready-made queue object (anything with push/pop/len) is returned unchanged.
+    """
+    if not isinstance(heap, str):
+        return heap
+    if heap not in HEAP_TYPES:
+        raise ValueError(f"Unknown heap type '{heap}'. Choose from: {', '.join(HEAP_TYPES)}")
+    if arity < 2:
+        raise ValueError('heap arity must be at least 2')
+    if heap == 'dial':
+        if max_weight is None:
+            raise ValueError("heap='dial' needs the graph's maximum integer edge weight")
+        return BucketQueue(max_weight)
+    if heap == 'radix':
+        return RadixHeap()
+    return HEAP_TYPES[heap](arity)
+
+def max_integer_weight(graph):
+    """
+    Largest edge weight if every weight is an integer, otherwise None.
+    O(1) for a CSRGraph; a VersionedGraph is scanned once per version.
+    """
+    if isinstance(graph, CSRGraph):
+        return graph.max_weight if graph.integer_weights else None
+    cached = getattr(graph, '_max_weight_scan', None)
+    if cached is not None and cached[0] == graph.version:
+        return cached[1]
+    max_weight = _scan_integer_weights(graph)
+    if isinstance(graph, VersionedGraph):
+        graph._max_weight_scan = (graph.version, max_weight)
+    return max_weight
+
+def _scan_integer_weights(graph):
+    # O(E) pass over a dict-of-dicts graph
+    max_weight = 0
+    for neighbors in graph.values():
+        for weight in neighbors.values():
+            if type(weight) is not int:
+                return None
+            if weight > max_weight:
+                max_weight = weight
+    return max_weight
+
+def select_heap(graph, heap='auto'):
+    """
+    Resolve heap='auto' to a concrete queue for graph, returning (heap, max_weight):
+    'dial' for integer weights up to DIAL_MAX_WEIGHT, 'radix' for larger integer
+    weights and 'lazy' otherwise. Plain dict graphs have no cheap way to know
+    their weights, so 'auto' keeps them on 'lazy' instead of scanning every edge
+    per query. Other heap names pass through unchanged.
+    """
+    if heap not in ('auto', 'dial', 'radix'):
+        return heap, None
+    if heap == 'auto' and not isinstance(graph, (CSRGraph, VersionedGraph)):
+        return 'lazy', None
+    max_weight = max_integer_weight(graph)
+    if heap != 'auto':
+        if max_weight is None:
+            raise ValueError(f"heap='{heap}' requires integer edge weights")
+        return heap, max_weight
+    if max_weight is None:
+        return 'lazy', None
+    return ('dial' if max_weight <= DIAL_MAX_WEIGHT else 'radix'), max_weight
+
+class SearchStats:
+    """
+    Counters for one or many dijkstra runs: nodes settled, edges relaxed, successful
+    relaxations, heap pushes/pops, stale entries popped, peak heap size and seconds
+    per phase ('setup' and 'search'). Pass stats=SearchStats() to dijkstra to fill
+    one in; runs without stats use the uninstrumented loop. Combine runs with
+    merge() or +, and export them with as_dict().
+    """
+
+    COUNTERS = ('queries', 'settled', 'edges_relaxed', 'improvements', 'pushes', 'pops', 'stale_pops')
+
+    def __init__(self):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.peak_heap = 0
+        self.phase_seconds = {}
+
+    def add_phase(self, phase, seconds):
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+
+    def merge(self, other):
+        """Add other's counters and phase times into this object (peak_heap keeps the maximum)"""
+        for name in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.peak_heap = max(self.peak_heap, other.peak_heap)
+        for phase, seconds in other.phase_seconds.items():
+            self.add_phase(phase, seconds)
+        return self
+
+    def __add__(self, other):
+        return SearchStats().merge(self).merge(other)
+
+    def as_dict(self):
+        result = {name: getattr(self, name) for name in self.COUNTERS}
+        result['peak_heap'] = self.peak_heap
+        result['phase_seconds'] = dict(self.phase_seconds)
+        return result
+
+    def __str__(self):
+        phases = ", ".join(f"{phase} {seconds * 1000:.2f} ms" for phase, seconds in self.phase_seconds.items())
+        return (f"{self.queries} quer{'y' if self.queries == 1 else 'ies'}: {self.settled} settled, "
+                f"{self.edges_relaxed} edges relaxed ({self.improvements} improved), {self.pushes} pushes, "
+                f"{self.pops} pops ({self.stale_pops} stale), peak heap {self.peak_heap}" + (f"; {phases}" if phases else ""))
+
+class CountingHeap:
+    """Wraps any dijkstra priority queue and counts pushes, pops and the peak size into a SearchStats"""
+
+    def __init__(self, heap, stats):
+        self.heap = heap
+        self.stats = stats
+
+    def push(self, item):
+        stats = self.stats
+        stats.pushes += 1
+        changed = self.heap.push(item)
+        if len(self.heap) > stats.peak_heap:
+            stats.peak_heap = len(self.heap)
+        return changed
+
+    def pop(self):
+        self.stats.pops += 1
+        return self.heap.pop()
+
+    def __len__(self):
+        return len(self.heap)
+
+# Compact graph representation
+class CSRGraph:
+    """
+    Compressed sparse row graph with interned integer node IDs.
+    Out-edges of node u live in targets/weights[offsets[u]:offsets[u + 1]],
+    all stored in typed arrays. labels/index map between IDs and the original
+    node names. The class also behaves like the read-only dict-of-dicts graph
+    (graph[label] -> {neighbor: weight}) so the menu code works on either.
+    """
+
+    def __init__(self, labels, offsets, targets, weights, max_weight=None):
+        self.labels = list(labels)
+        self.index = {label: i for i, label in enumerate(self.labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.num_nodes = len(self.labels)
+        self.num_edges = len(self.targets)
+        self.weight_typecode = _typecode(weights)
+        self.integer_weights = self.weight_typecode == 'q'
+        if max_weight is None:
+            max_weight = max(weights) if len(weights) else 0
+        self.max_weight = max_weight
+        self._reverse = None
+
+    @classmethod
+    def from_edges(cls, edges, labels=None):
+        """Build from (source, destination, weight) label triples (parallel edges are kept)"""
+        labels = list(labels) if labels is not None else []
+        index = {label: i for i, label in enumerate(labels)}
+        sources, dests, edge_weights = [], [], []
+        for source, destination, weight in edges:
+            for label in (source, destination):
+                if label not in index:
+                    index[label] = len(labels)
+                    labels.append(label)
+            sources.append(index[source])
+            dests.append(index[destination])
+            edge_weights.append(weight)
+        return cls.from_id_edges(labels, sources, dests, edge_weights)
+
+    @classmethod
+    def from_id_edges(cls, labels, sources, dests, edge_weights):
+        """Build from parallel sequences of integer source/destination IDs and weights"""
+        n, m = len(labels), len(sources)
+        if _typecode(edge_weights) == 'q':
+            typecode, convert = 'q', None
+        elif all(float(w).is_integer() for w in edge_weights):
+            typecode, convert = 'q', int
+        else:
+            typecode, convert = 'd', None
+
+        # Counting sort by source ID: stable, so each node's edges keep their input order,
+        # and it needs only typed arrays rather than a list of edge positions
+        offsets = array('q', bytes(8 * (n + 1)))
+        for u in sources:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+        cursor = array('q', offsets)
+        targets = array('q', bytes(8 * m))
+        weights = array(typecode, bytes(8 * m))
+        for u, v, weight in zip(sources, dests, edge_weights):
+            position = cursor[u]
+            cursor[u] = position + 1
+            targets[position] = v
+            weights[position] = convert(weight) if convert else weight
+        return cls(labels, offsets, targets, weights)
+
+    @classmethod
+    def from_dict(cls, graph):
+        """Build from the dict-of-dicts graph returned by load_graph_from_csv"""
+        labels = list(graph)
+        extra = set()  # Destinations that are not keys themselves get one ID each
+        for source in graph:
+            for destination in graph[source]:
+                if destination not in graph and destination not in extra:
+                    extra.add(destination)
+                    labels.append(destination)
+        edges = ((u, v, w) for u in graph for v, w in graph[u].items())
+        return cls.from_edges(edges, labels)
+
+    def neighbors(self, u):
+        """Yield (v, weight) ID pairs for the out-edges of node ID u"""
+        targets, weights = self.targets, self.weights
+        for e in range(self.offsets[u], self.offsets[u + 1]):
+            yield targets[e], weights[e]
+
+    def reverse(self):
+        """CSR graph with every edge flipped (built once and cached)"""
+        if self._reverse is None:
+            sources = []
+            for u in range(self.num_nodes):
+                sources.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+            self._reverse = CSRGraph.from_id_edges(self.labels, self.targets, sources, self.weights)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def node_map(self, values, ids=False):
+        """Read-only label-keyed view over a per-node-ID list (ids=True maps IDs back to labels)"""
+        return NodeMap(self, values, ids)
+
+    def label_path(self, path_ids):
+        """Translate a list of node IDs into labels"""
+        labels = self.labels
+        return [labels[u] for u in path_ids]
+
+    def __reduce__(self):
+        # Cache-loaded graphs hold memoryviews into an mmap, which cannot be pickled
+        # (e.g. for spawn-based process pools); send plain typed arrays instead
+        def plain(values, typecode):
+            return array(typecode, values.tobytes()) if isinstance(values, memoryview) else values
+        return (CSRGraph, (self.labels, plain(self.offsets, 'q'), plain(self.targets, 'q'),
+                           plain(self.weights, self.weight_typecode), self.max_weight))
+
+    def memory_bytes(self):
+        """Bytes held by the offset/target/weight arrays"""
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.targets, self.weights))
+
+    # Dict-of-dicts compatibility for the interactive menu
+    def __getitem__(self, label):
+        u = self.index[label]
+        return {self.labels[v]: w for v, w in self.neighbors(u)}
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return self.num_nodes
+
+    def get(self, label, default=None):
+        return self[label] if label in self.index else default
+
+    def keys(self):
+        return list(self.labels)
+
+    def items(self):
+        return ((label, self[label]) for label in self.labels)
+
+def _typecode(values):
+    # Element type of an array.array or memoryview ('q', 'd'), None for plain sequences
+    return getattr(values, 'typecode', None) or getattr(values, 'format', None)
+
+class NodeMap(Mapping):
+    """Label-keyed view over a list indexed by CSR node ID"""
+
+    def __init__(self, graph, values, ids=False):
+        self.graph = graph
+        self.values = values
+        self.ids = ids
+
+    def __getitem__(self, label):
+        value = self.values[self.graph.index[label]]
+        if self.ids:
+            return None if value < 0 else self.graph.labels[value]
+        return value
+
+    def __iter__(self):
+        return iter(self.graph.labels)
+
+    def __len__(self):
+        return self.graph.num_nodes
+
+class VersionedGraph(dict):
+    """
+    Mutable dict-of-dicts graph with a version counter.
+    Every change made through add_edge/remove_edge/add_node/remove_node bumps
+    version, which caches and indexes built on the graph use to detect staleness.
+    Editing the inner neighbour dicts directly bypasses the counter; call touch() after doing so.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def touch(self):
+        """Record an external modification"""
+        self.version += 1
+
+    def add_node(self, node):
+        if node not in self:
+            self[node] = {}
+            self.touch()
+
+    def add_edge(self, source, destination, weight):
+        """Insert an edge or change its weight"""
+        if source not in self:
+            self[source] = {}
+        if destination not in self:
+            self[destination] = {}
+        self[source][destination] = weight
+        self.touch()
+
+    def remove_edge(self, source, destination):
+        del self[source][destination]
+        self.touch()
+
+    def remove_node(self, node):
+        del self[node]
+        for neighbors in self.values():
+            neighbors.pop(node, None)
+        self.touch()
+
+# Binary graph cache (memory-mapped CSR arrays next to the CSV)
+GRAPH_CACHE_MAGIC = b'CSC2103GC'
+GRAPH_CACHE_VERSION = 1
+# magic, version, weight typecode, nodes, edges, max weight, CSV mtime_ns, CSV size, CSV sha256, labels length
+GRAPH_CACHE_HEADER = struct.Struct('<9sHcqqdqq32sq')
+
+def graph_cache_path(csv_path):
+    """Default cache file for a CSV: same name with a .graphcache extension"""
+    return os.path.splitext(csv_path)[0] + ".graphcache"
+
+def _file_sha256(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+def write_graph_cache(graph, csv_path, cache_path=None):
+    """Write a CSRGraph as a versioned binary cache keyed on the CSV's mtime, size and SHA-256"""
+    cache_path = cache_path or graph_cache_path(csv_path)
+    stat = os.stat(csv_path)
+    labels = json.dumps(graph.labels).encode('utf-8')
+    header = GRAPH_CACHE_HEADER.pack(
+        GRAPH_CACHE_MAGIC, GRAPH_CACHE_VERSION, graph.weight_typecode.encode('ascii'),
+        graph.num_nodes, graph.num_edges, float(graph.max_weight),
+        stat.st_mtime_ns, stat.st_size, _file_sha256(csv_path), len(labels))
+    padding = b'\0' * (-len(header) % 8)  # Keep the arrays 8-byte aligned
+
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(header + padding)
+        for values in (graph.offsets, graph.targets, graph.weights):
+            file.write(values.tobytes())
+        file.write(labels)
+    os.replace(temp_path, cache_path)
+    return cache_path
+
+def read_graph_cache(cache_path, csv_path=None):
+    """
+    Memory-map a graph cache; the CSR arrays stay in the mapped file as memoryviews.
+    Returns None when the file is missing, malformed or no longer matches csv_path.
+    """
+    try:
+        with open(cache_path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        (magic, version, typecode, n, m, max_weight, mtime_ns, size, sha256,
+         labels_len) = GRAPH_CACHE_HEADER.unpack_from(mapping, 0)
+    except struct.error:
+        mapping.close()
+        return None
+    if magic != GRAPH_CACHE_MAGIC or version != GRAPH_CACHE_VERSION:
+        mapping.close()
+        return None
+
+    if csv_path is not None:
+        stat = os.stat(csv_path)
+        if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size) and _file_sha256(csv_path) != sha256:
+            mapping.close()
+            return None
+
+    position = GRAPH_CACHE_HEADER.size + (-GRAPH_CACHE_HEADER.size % 8)
+    # A truncated or corrupt file must not be sliced past its end
+    if (typecode not in (b'q', b'd') or min(n, m, labels_len) < 0 or
+            len(mapping) < position + 8 * (n + 1) + 16 * m + labels_len):
+        mapping.close()
+        return None
+
+    typecode = typecode.decode('ascii')
+    try:
+        view = memoryview(mapping)
+        offsets = view[position:position + 8 * (n + 1)].cast('q')
+        position += 8 * (n + 1)
+        targets = view[position:position + 8 * m].cast('q')
+        position += 8 * m
+        weights = view[position:position + 8 * m].cast(typecode)
+        position += 8 * m
+        labels = json.loads(bytes(view[position:position + labels_len]).decode('utf-8'))
+        if not isinstance(labels, list) or len(labels) != n:
+            raise ValueError('label count does not match the header')
+    except (ValueError, TypeError, UnicodeDecodeError):
+        # The views still reference the map, so it is released when they are collected
+        return None
+
+    graph = CSRGraph(labels, offsets, targets, weights, max_weight=int(max_weight) if typecode == 'q' else max_weight)
+    graph.mapping = mapping  # Keep the map open for as long as the graph lives
+    return graph
+
+def load_graph_cached(csv_path, cache_path=None):
+    """
+    Load a CSV as a CSRGraph, reusing the binary cache next to it when still valid.
+    The first run parses the CSV and writes the cache; later runs just memory-map it.
+    """
+    cache_path = cache_path or graph_cache_path(csv_path)
+    graph = read_graph_cache(cache_path, csv_path)
+    if graph is not None:
+        return graph
+    graph = load_graph_from_csv(csv_path, compact=True)
+    try:
+        write_graph_cache(graph, csv_path, cache_path)
+    except OSError:
+        pass  # Read-only location: still return the parsed graph
+    return graph
+
 # Dijkstra algorithm (depends on MinHeap above)
-def dijkstra_with_visualization(graph, start):
-    """Dijkstra algorithm with visualization"""
+# Trace events: (kind, *fields) tuples emitted by dijkstra_trace
+TRACE_NODES = 'n'    # ('n', node, node, ...) every node of the graph, emitted first
+TRACE_PUSH = 'p'     # ('p', node, priority)
+TRACE_STALE = 'x'    # ('x', node, priority) popped entry that was already outdated
+TRACE_SETTLE = 's'   # ('s', node, distance) node finalised; starts a new step
+TRACE_RELAX = 'r'    # ('r', u, v, old distance, new distance) successful relaxation
+TRACE_FORMAT = 1
+
+def dijkstra_trace(graph, start, emit):
+    """
+    Dijkstra on a dict-of-dicts graph that reports every action through emit(event)
+    instead of printing. Pass events.append to keep them in memory or a TraceRecorder
+    to stream them to a file. Returns (dist, prev) like dijkstra.
+    """
     dist = {node: float('inf') for node in graph}
     prev = {node: None for node in graph}
     visited = set()
     dist[start] = 0
-    
+    emit((TRACE_NODES, *graph))
+
     heap = MinHeap()
     heap.push((0, start))
-    
-    step = 0
-    print(f"\n{'='*60}")
-    print(f"Dijkstra Algorithm - Start: {start}")
-    print(f"{'='*60}")
-    
-    # Display initial state
-    print_step_diagram(step, dist, visited, None, None, heap, graph, prev)
-    
+    emit((TRACE_PUSH, start, 0))
+
     while len(heap):
-        step += 1
         current_dist, u = heap.pop()
-        
-        if current_dist > dist[u]:
+        if current_dist > dist[u] or u in visited:
+            emit((TRACE_STALE, u, current_dist))
             continue
-            
-        if u in visited:
-            continue
-            
         visited.add(u)
-        
-        print(f"\nStep {step}: Processing {u}")
-        
-        # Display current processing node
-        print_step_diagram(step, dist, visited, u, None, heap, graph, prev)
-        
-        # Check all neighboring nodes
-        neighbors_updated = []
-        
-        for v in graph[u]:
-            alt = current_dist + graph[u][v]
-            
+        emit((TRACE_SETTLE, u, current_dist))
+
+        for v, weight in graph[u].items():
+            alt = current_dist + weight
             if alt < dist[v]:
-                old_dist = dist[v]
+                emit((TRACE_RELAX, u, v, dist[v], alt))
                 dist[v] = alt
                 prev[v] = u
                 heap.push((alt, v))
-                neighbors_updated.append((v, old_dist, alt))
-        
-        # If there are updates, display updated state
-        if neighbors_updated:
-            print_step_diagram(step, dist, visited, u, neighbors_updated, heap, graph, prev)
-        
-        input("\nPress Enter to continue...")
-    
+                emit((TRACE_PUSH, v, alt))
+    return dist, prev
+
+class TraceRecorder:
+    """
+    emit callback for dijkstra_trace that buffers events and writes them as
+    tab-separated rows (first row: format version and start node)
+    """
+
+    def __init__(self, filename, start, buffer_size=4096):
+        self.file = open(filename, 'w', encoding='utf-8', newline='')
+        self.writer = csv.writer(self.file, delimiter='\t', lineterminator='\n')
+        self.writer.writerow(('#trace', TRACE_FORMAT, start))
+        self.buffer = []
+        self.buffer_size = buffer_size
+
+    def __call__(self, event):
+        self.buffer.append(event)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.writer.writerows(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def record_trace(graph, start, filename):
+    """Run dijkstra_trace from start and write its event stream to filename; returns (dist, prev)"""
+    with TraceRecorder(filename, start) as recorder:
+        return dijkstra_trace(graph, start, recorder)
+
+def _trace_number(text):
+    return int(text) if text.lstrip('-').isdigit() else float(text)
+
+def load_trace(filename):
+    """Read a file written by TraceRecorder; returns (start, events)"""
+    with open(filename, encoding='utf-8', newline='') as file:
+        reader = csv.reader(file, delimiter='\t')
+        header = next(reader)
+        if header[:2] != ['#trace', str(TRACE_FORMAT)]:
+            raise ValueError(f"{filename} is not a Dijkstra trace file")
+        events = []
+        for row in reader:
+            kind = row[0]
+            if kind == TRACE_RELAX:
+                events.append((kind, row[1], row[2], _trace_number(row[3]), _trace_number(row[4])))
+            elif kind == TRACE_NODES:
+                events.append(tuple(row))
+            else:
+                events.append((kind, row[1], _trace_number(row[2])))
+    return header[2], events
+
+class TraceReplayer:
+    """
+    Rebuilds the dist/prev/visited state of a recorded run one step (settled node)
+    at a time. seek() jumps to any step, replaying forwards from the current
+    position or from the beginning, and render() prints only the table rows that
+    changed since the previous render.
+    """
+
+    FULL_TABLE_LIMIT = 50   # Larger graphs never print the full table
+
+    def __init__(self, start, events):
+        self.start = start
+        self.events = events
+        self.step_positions = [i for i, event in enumerate(events) if event[0] == TRACE_SETTLE]
+        self.num_steps = len(self.step_positions)
+        self.nodes = list(events[0][1:]) if events and events[0][0] == TRACE_NODES else []
+        self._reset()
+
+    def _reset(self):
+        self.step = 0
+        self.position = 0
+        self.dist = {node: float('inf') for node in self.nodes}
+        self.prev = {node: None for node in self.nodes}
+        if self.start in self.dist:
+            self.dist[self.start] = 0
+        self.visited = set()
+        self.current = None
+        self.queued = 0
+        self.stale = 0
+        # After a reset the next render shows the whole table, or only touched rows for large graphs
+        self.changed = set(self.nodes) if len(self.nodes) <= self.FULL_TABLE_LIMIT else {self.start}
+        self.updates = []
+
+    def seek(self, step):
+        """Move to the state after step has settled its node and relaxed its edges (0 = initial state)"""
+        step = max(0, min(step, self.num_steps))
+        if step < self.step:
+            self._reset()
+        end = self.step_positions[step] if step < self.num_steps else len(self.events)
+        while self.position < end:
+            self._apply(self.events[self.position])
+            self.position += 1
+        return self.step
+
+    def _apply(self, event):
+        kind = event[0]
+        if kind == TRACE_PUSH:
+            self.queued += 1
+        elif kind == TRACE_STALE:
+            self.queued -= 1
+            self.stale += 1
+        elif kind == TRACE_SETTLE:
+            self.queued -= 1
+            self.step += 1
+            if self.current is not None:
+                self.changed.add(self.current)
+            self.current = event[1]
+            self.visited.add(event[1])
+            self.changed.add(event[1])
+            self.updates = []
+        elif kind == TRACE_RELAX:
+            _, u, v, old, new = event
+            self.dist[v] = new
+            self.prev[v] = u
+            self.changed.add(v)
+            self.updates.append((v, old, new))
+
+    def render(self):
+        """Print the current step: changed table rows and the distance updates it made"""
+        if self.step == 0:
+            print(f"Initial state ({len(self.nodes)} nodes, start {self.start})")
+        else:
+            print(f"\nStep {self.step}/{self.num_steps}: Processing {self.current} "
+                  f"(queue {self.queued}, stale pops so far {self.stale})")
+        if self.step == 0 and len(self.nodes) > self.FULL_TABLE_LIMIT:
+            print(f"({len(self.nodes) - 1} other nodes start at ∞)")
+        print_dijkstra_table(self.changed, self.dist, self.visited, self.current, self.prev)
+        if self.updates:
+            print(f"\nUpdated:")
+            for node, old_dist, new_dist in self.updates:
+                old_str = "∞" if old_dist == float('inf') else str(old_dist)
+                print(f"  {node}: {old_str} → {new_dist}")
+        self.changed = set()
+
+def replay_trace(filename, step=None):
+    """Print a recorded trace step by step, or only the state at one step"""
+    replayer = TraceReplayer(*load_trace(filename))
+    if step is not None:
+        replayer.seek(step)
+        replayer.render()
+        return replayer
+    replayer.render()
+    for next_step in range(1, replayer.num_steps + 1):
+        replayer.seek(next_step)
+        replayer.render()
+    return replayer
+
+def dijkstra_with_visualization(graph, start, interactive=True, trace_file=None):
+    """
+    Dijkstra algorithm with visualization.
+    The search runs headless through dijkstra_trace and its event stream is then
+    replayed one step at a time, printing only the rows each step changed. When
+    interactive, Enter advances and a step number jumps straight to that step.
+    trace_file additionally saves the event stream for replay_trace.
+    """
+    events = []
+    dist, prev = dijkstra_trace(graph, start, events.append)
+    if trace_file is not None:
+        with TraceRecorder(trace_file, start) as recorder:
+            for event in events:
+                recorder(event)
+
+    print(f"\n{'='*60}")
+    print(f"Dijkstra Algorithm - Start: {start}")
+    print(f"{'='*60}")
+
+    replayer = TraceReplayer(start, events)
+    replayer.render()
+    next_step = 1
+    while next_step <= replayer.num_steps:
+        replayer.seek(next_step)
+        replayer.render()
+        next_step = replayer.step + 1
+        if interactive and next_step <= replayer.num_steps:
+            answer = input(f"\nPress Enter to continue (or type a step 1-{replayer.num_steps} to jump)... ").strip()
+            if answer.isdigit():
+                next_step = int(answer)
+
     print(f"\n{'='*60}")
     print("Algorithm Complete!")
     print(f"{'='*60}")
     print_final_diagram_and_table(dist, prev, start, graph)
-    
+
     return dist, prev
 
-def dijkstra(graph, start):
-    """Original Dijkstra algorithm (no visualization)"""
+def dijkstra(graph, start, heap='auto', arity=2, target=None, stats=None):
+    """
+    Original Dijkstra algorithm (no visualization)
+    heap selects 'lazy' or 'indexed' with the given arity, 'dial' or 'radix' for
+    integer weights, or 'auto' (see select_heap); with a target the search stops
+    as soon as target is settled (other distances may be tentative).
+    stats (a SearchStats) collects operation counters and phase timings.
+    """
+    if isinstance(graph, CSRGraph):
+        target_id = graph.index[target] if target is not None else -1
+        dist, prev = dijkstra_csr(graph, graph.index[start], heap, arity, target_id, stats)
+        return graph.node_map(dist), graph.node_map(prev, ids=True)
+
+    setup_start = time.perf_counter()
     dist = {node: float('inf') for node in graph}
     prev = {node: None for node in graph}
     dist[start] = 0
 
-    heap = MinHeap()
+    heap, max_weight = select_heap(graph, heap)
+    heap = make_heap(heap, arity, max_weight)
+    if stats is not None:
+        stats.add_phase('setup', time.perf_counter() - setup_start)
+        _counted_search(lambda u: graph[u].items(), dist, prev, start, heap, target, stats)
+        return dist, prev
     heap.push((0, start))
 
     while len(heap):
         current_dist, u = heap.pop()
         if current_dist > dist[u]:
             continue
+        if u == target:
+            break
         for v in graph[u]:
             alt = current_dist + graph[u][v]
             if alt < dist[v]:
@@ -148,6 +1041,662 @@ def dijkstra(graph, start):
                 heap.push((alt, v))
     return dist, prev
 
+def dijkstra_csr(graph, source, heap='auto', arity=2, target=-1, stats=None):
+    """Dijkstra over a CSRGraph using node IDs; returns dist and prev lists (-1 = no predecessor)"""
+    setup_start = time.perf_counter()
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [float('inf')] * graph.num_nodes
+    prev = [-1] * graph.num_nodes
+    dist[source] = 0
+
+    heap, max_weight = select_heap(graph, heap)
+    heap = make_heap(heap, arity, max_weight)
+    if stats is not None:
+        stats.add_phase('setup', time.perf_counter() - setup_start)
+        _counted_search(graph.neighbors, dist, prev, source, heap, target, stats)
+        return dist, prev
+    heap.push((0, source))
+
+    while len(heap):
+        current_dist, u = heap.pop()
+        if current_dist > dist[u]:
+            continue
+        if u == target:
+            break
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            alt = current_dist + weights[e]
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                heap.push((alt, v))
+    return dist, prev
+
+def _counted_search(neighbors, dist, prev, source, heap, target, stats):
+    # Instrumented main loop shared by dijkstra and dijkstra_csr; neighbors(u) yields (v, weight)
+    search_start = time.perf_counter()
+    stats.queries += 1
+    heap = CountingHeap(heap, stats)
+    heap.push((0, source))
+    while len(heap):
+        current_dist, u = heap.pop()
+        if current_dist > dist[u]:
+            stats.stale_pops += 1
+            continue
+        stats.settled += 1
+        if u == target:
+            break
+        for v, weight in neighbors(u):
+            stats.edges_relaxed += 1
+            alt = current_dist + weight
+            if alt < dist[v]:
+                stats.improvements += 1
+                dist[v] = alt
+                prev[v] = u
+                heap.push((alt, v))
+    stats.add_phase('search', time.perf_counter() - search_start)
+
+class SearchWorkspace:
+    """
+    Reusable dist/prev arrays for running many dijkstra queries on one CSRGraph.
+    dist (array 'q' for integer weights, 'd' otherwise) and prev (array 'q',
+    -1 = none) are indexed by node ID and allocated once; unreached nodes hold
+    self.unreached. Each search records the nodes it reaches in touched and the
+    next search resets only those, so a query that stays local costs O(touched)
+    instead of O(V) allocation and initialisation. Results stay valid until the
+    next search.
+    """
+
+    def __init__(self, graph, heap='auto', arity=2):
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        self.graph = graph
+        self.heap, self.max_weight = select_heap(graph, heap)
+        self.arity = arity
+        # Integer distances stay integers so the Dial and radix queues can bucket them
+        typecode = 'q' if graph.integer_weights else 'd'
+        self.unreached = 2 ** 63 - 1 if graph.integer_weights else float('inf')
+        self.dist = array(typecode, [self.unreached]) * graph.num_nodes
+        self.prev = array('q', [-1]) * graph.num_nodes
+        self.touched = []
+        self.source = -1
+        self.queries = 0
+
+    def reset(self):
+        """Restore every node touched by the last search to unreached / -1"""
+        dist, prev, unreached = self.dist, self.prev, self.unreached
+        for v in self.touched:
+            dist[v] = unreached
+            prev[v] = -1
+        self.touched.clear()
+        self.source = -1
+
+    def search(self, source, target=-1):
+        """Dijkstra from node ID source, stopping once target is settled; returns self"""
+        self.reset()
+        self.queries += 1
+        offsets, targets, weights = self.graph.offsets, self.graph.targets, self.graph.weights
+        dist, prev, touched, unreached = self.dist, self.prev, self.touched, self.unreached
+        self.source = source
+        dist[source] = 0
+        touched.append(source)
+        heap = make_heap(self.heap, self.arity, self.max_weight)
+        heap.push((0, source))
+
+        while len(heap):
+            current_dist, u = heap.pop()
+            if current_dist > dist[u]:
+                continue
+            if u == target:
+                break
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                alt = current_dist + weights[e]
+                old = dist[v]
+                if alt < old:
+                    if old == unreached:
+                        touched.append(v)
+                    dist[v] = alt
+                    prev[v] = u
+                    heap.push((alt, v))
+        return self
+
+    def distance(self, node):
+        """Distance of node ID from the last source (int for integer weights, inf if unreached)"""
+        d = self.dist[node]
+        return float('inf') if d == self.unreached else d
+
+    def path(self, node):
+        """Node IDs on the shortest path from the last source to node ([] if unreached)"""
+        if self.dist[node] == self.unreached:
+            return []
+        return reconstruct_path_ids(self.prev, self.source, node)
+
+    def result(self):
+        """Copies of (dist, prev) as lists, like dijkstra_csr (O(V))"""
+        return [self.distance(v) for v in range(self.graph.num_nodes)], self.prev.tolist()
+
+def multi_source_dijkstra(graph, sources):
+    """
+    Dijkstra seeded with every source at distance 0.
+    Returns (dist, prev, owner) where owner[node] is the source whose search
+    reached node first, i.e. its nearest source (None when unreachable).
+    """
+    if isinstance(graph, CSRGraph):
+        dist, prev, owner = multi_source_dijkstra_csr(graph, [graph.index[label] for label in sources])
+        return graph.node_map(dist), graph.node_map(prev, ids=True), graph.node_map(owner, ids=True)
+
+    dist = {node: float('inf') for node in graph}
+    prev = {node: None for node in graph}
+    owner = {node: None for node in graph}
+    heap = MinHeap()
+    for source in sources:
+        if dist[source] > 0:
+            dist[source] = 0
+            owner[source] = source
+            heap.push((0, source))
+
+    while len(heap):
+        current_dist, u = heap.pop()
+        if current_dist > dist[u]:
+            continue
+        for v, weight in graph[u].items():
+            alt = current_dist + weight
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                owner[v] = owner[u]
+                heap.push((alt, v))
+    return dist, prev, owner
+
+def multi_source_dijkstra_csr(graph, sources):
+    """multi_source_dijkstra over a CSRGraph using node IDs (-1 = no predecessor / owner)"""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [float('inf')] * graph.num_nodes
+    prev = [-1] * graph.num_nodes
+    owner = [-1] * graph.num_nodes
+    heap = MinHeap()
+    for source in sources:
+        if dist[source] > 0:
+            dist[source] = 0
+            owner[source] = source
+            heap.push((0, source))
+
+    while len(heap):
+        current_dist, u = heap.pop()
+        if current_dist > dist[u]:
+            continue
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            alt = current_dist + weights[e]
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                owner[v] = owner[u]
+                heap.push((alt, v))
+    return dist, prev, owner
+
+def distance_table(graph, sources, targets, reverse_graph=None):
+    """
+    Many-to-many distances as table[source][target] (labels; inf when unreachable).
+    Runs one search per node on the smaller side (backward over the reverse graph
+    when there are fewer targets) and stops each search once the whole other side
+    is settled. For repeated tables on a static graph use
+    ContractionHierarchy.many_to_many, which shares work through buckets.
+    """
+    sources, targets = list(sources), list(targets)
+    backward = len(targets) < len(sources)
+    if backward and reverse_graph is None:
+        reverse_graph = build_reverse_graph(graph)
+    origins, wanted = (targets, sources) if backward else (sources, targets)
+    search_graph = reverse_graph if backward else graph
+
+    if isinstance(graph, CSRGraph):
+        rows = {}
+        wanted_ids = [graph.index[label] for label in wanted]
+        for origin in origins:
+            found = _settle_all(search_graph.neighbors, graph.index[origin], wanted_ids)
+            rows[origin] = {label: found[u] for label, u in zip(wanted, wanted_ids)}
+    else:
+        rows = {origin: _settle_all(lambda u: search_graph.get(u, {}).items(), origin, wanted) for origin in origins}
+
+    if backward:
+        return {source: {target: rows[target][source] for target in targets} for source in sources}
+    return {source: dict(rows[source]) for source in sources}
+
+def _settle_all(edges, start, wanted):
+    # Dijkstra from start until every node in wanted is settled; edges(u) yields (neighbor, weight)
+    remaining = set(wanted)
+    found = dict.fromkeys(remaining, float('inf'))
+    dist = {start: 0}
+    heap = MinHeap()
+    heap.push((0, start))
+    while len(heap) and remaining:
+        current_dist, u = heap.pop()
+        if current_dist > dist[u]:
+            continue
+        if u in remaining:
+            found[u] = current_dist
+            remaining.discard(u)
+        for v, weight in edges(u):
+            alt = current_dist + weight
+            if alt < dist.get(v, float('inf')):
+                dist[v] = alt
+                heap.push((alt, v))
+    return found
+
+def build_reverse_graph(graph):
+    """Reverse adjacency index: reverse[v][u] = weight of edge u -> v"""
+    if isinstance(graph, CSRGraph):
+        return graph.reverse()
+    reverse = {node: {} for node in graph}
+    for u in graph:
+        for v, weight in graph[u].items():
+            reverse.setdefault(v, {})[u] = weight
+    return reverse
+
+def bidirectional_dijkstra(graph, start, end, reverse_graph=None):
+    """
+    Point-to-point shortest path searching forward from start and backward from end.
+    Stops once the two frontier minimums together reach the best meeting distance.
+    Returns (distance, path); (inf, []) when end is unreachable.
+    """
+    if start == end:
+        return 0, [start]
+    if reverse_graph is None:
+        reverse_graph = build_reverse_graph(graph)
+
+    if isinstance(graph, CSRGraph):
+        distance, path = _bidirectional_search(graph.neighbors, reverse_graph.neighbors,
+                                               graph.index[start], graph.index[end])
+        return distance, graph.label_path(path)
+    return _bidirectional_search(lambda u: graph[u].items(), lambda u: reverse_graph.get(u, {}).items(),
+                                 start, end)
+
+def _bidirectional_search(forward_edges, backward_edges, start, end):
+    # Shared core of bidirectional_dijkstra; *_edges(u) yield (neighbor, weight) pairs
+    dist = ({start: 0}, {end: 0})
+    prev = ({start: None}, {end: None})
+    settled = (set(), set())
+    heaps = (MinHeap(), MinHeap())
+    heaps[0].push((0, start))
+    heaps[1].push((0, end))
+    edges = (forward_edges, backward_edges)
+
+    best = float('inf')
+    meeting = None
+    while len(heaps[0]) and len(heaps[1]):
+        if heaps[0].data[0][0] + heaps[1].data[0][0] >= best:
+            break
+
+        # Expand the side with the smaller frontier key
+        side = 0 if heaps[0].data[0][0] <= heaps[1].data[0][0] else 1
+        other = 1 - side
+        current_dist, u = heaps[side].pop()
+        if current_dist > dist[side][u] or u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        for v, weight in edges[side](u):
+            alt = current_dist + weight
+            if alt < dist[side].get(v, float('inf')):
+                dist[side][v] = alt
+                prev[side][v] = u
+                heaps[side].push((alt, v))
+            if v in dist[other] and alt + dist[other][v] < best:
+                best = alt + dist[other][v]
+                meeting = v
+
+    if meeting is None:
+        return float('inf'), []
+
+    # Forward half: start .. meeting, backward half: meeting .. end
+    path = []
+    node = meeting
+    while node is not None:
+        path.append(node)
+        node = prev[0][node]
+    path.reverse()
+    node = prev[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = prev[1][node]
+    return best, path
+
+def shortest_path(graph, start, end, method='bidirectional', reverse_graph=None, heap='auto', arity=2,
+                  heuristic=None, landmarks=None, workspace=None, reachability=None):
+    """
+    Point-to-point query returning (distance, path).
+    method='bidirectional' meets in the middle; method='dijkstra' stops once end is settled;
+    method='astar' uses heuristic and method='alt' uses a LandmarkIndex.
+    With method='dijkstra' a SearchWorkspace for graph avoids per-query O(V) setup.
+    A ReachabilityIndex answers unreachable queries before any search starts.
+    """
+    if reachability is not None and not reachability.may_reach(start, end):
+        return float('inf'), []
+    if method == 'bidirectional':
+        return bidirectional_dijkstra(graph, start, end, reverse_graph)
+    if method == 'astar':
+        return astar(graph, start, end, heuristic)
+    if method == 'alt':
+        return alt_search(graph, start, end, landmarks)
+    if method != 'dijkstra':
+        raise ValueError(f"Unknown shortest path method '{method}'")
+    if workspace is not None:
+        index = workspace.graph.index
+        workspace.search(index[start], index[end])
+        return workspace.distance(index[end]), workspace.graph.label_path(workspace.path(index[end]))
+    dist, prev = dijkstra(graph, start, heap, arity, target=end)
+    if dist[end] == float('inf'):
+        return float('inf'), []
+    return dist[end], reconstruct_path(prev, start, end)
+
+def astar(graph, start, end, heuristic=None):
+    """
+    A* point-to-point search returning (distance, path).
+    heuristic(node, end) must be an admissible, consistent lower bound on the
+    remaining distance (node IDs for a CSRGraph, labels otherwise); None gives plain Dijkstra.
+    """
+    if isinstance(graph, CSRGraph):
+        distance, path = _astar_search(graph.neighbors, graph.index[start], graph.index[end], heuristic)
+        return distance, graph.label_path(path)
+    return _astar_search(lambda u: graph[u].items(), start, end, heuristic)
+
+def _astar_search(edges, start, end, heuristic):
+    # Shared core of astar; edges(u) yields (neighbor, weight) pairs
+    if heuristic is None:
+        heuristic = lambda node, target: 0
+    dist = {start: 0}
+    prev = {start: None}
+    closed = set()
+
+    heap = MinHeap()
+    heap.push((heuristic(start, end), start))
+    while len(heap):
+        _, u = heap.pop()
+        if u in closed:
+            continue
+        if u == end:
+            path = []
+            while u is not None:
+                path.append(u)
+                u = prev[u]
+            path.reverse()
+            return dist[end], path
+        closed.add(u)
+
+        for v, weight in edges(u):
+            alt = dist[u] + weight
+            if alt < dist.get(v, float('inf')):
+                estimate = heuristic(v, end)
+                if estimate == float('inf'):
+                    continue  # Landmarks prove v cannot reach end
+                dist[v] = alt
+                prev[v] = u
+                heap.push((alt + estimate, v))
+    return float('inf'), []
+
+class LandmarkIndex:
+    """
+    Precomputed landmark distances for ALT (A*, Landmarks, Triangle inequality).
+    For every landmark L we store d(L, v) and d(v, L) for all nodes v, so
+    d(v, t) >= max(d(L, t) - d(L, v), d(v, L) - d(t, L)) gives an admissible heuristic.
+    Landmarks are picked greedily, each one farthest from those already chosen.
+    Build once after loading the graph and pass it to alt_search / shortest_path.
+    """
+
+    def __init__(self, graph, num_landmarks=4, reverse_graph=None):
+        start_time = time.perf_counter()
+        self.is_csr = isinstance(graph, CSRGraph)
+        nodes = range(graph.num_nodes) if self.is_csr else list(graph)
+        self.index = None if self.is_csr else {node: i for i, node in enumerate(nodes)}
+        if reverse_graph is None:
+            reverse_graph = build_reverse_graph(graph)
+
+        self.landmarks = []
+        self.dist_from = []   # dist_from[k][i] = d(landmark k, node i)
+        self.dist_to = []     # dist_to[k][i] = d(node i, landmark k)
+        closest = [float('inf')] * len(nodes)  # Distance from the nearest chosen landmark
+        candidate = 0
+        for _ in range(min(num_landmarks, len(nodes))):
+            landmark = nodes[candidate]
+            self.landmarks.append(landmark)
+            self.dist_from.append(self._distances(graph, landmark, nodes))
+            self.dist_to.append(self._distances(reverse_graph, landmark, nodes))
+
+            # Next landmark: farthest node from every landmark so far (unreached nodes first)
+            latest = self.dist_from[-1]
+            for i in range(len(nodes)):
+                if latest[i] < closest[i]:
+                    closest[i] = latest[i]
+            closest[candidate] = -1.0
+            candidate = max(range(len(nodes)), key=closest.__getitem__)
+            if closest[candidate] < 0:
+                break
+        self.preprocess_seconds = time.perf_counter() - start_time
+
+    def _distances(self, graph, landmark, nodes):
+        # Single-source distances from landmark as a typed array indexed like nodes
+        if self.is_csr:
+            dist, _ = dijkstra_csr(graph, landmark)
+            return array('d', dist)
+        dist, _ = dijkstra(graph, landmark)
+        return array('d', (dist.get(node, float('inf')) for node in nodes))
+
+    def heuristic(self, node, target):
+        """Largest triangle-inequality lower bound on d(node, target) over all landmarks"""
+        if self.is_csr:
+            i, t = node, target
+        else:
+            i, t = self.index[node], self.index[target]
+        best = 0
+        for dist_from, dist_to in zip(self.dist_from, self.dist_to):
+            # inf - inf is nan and never wins; inf - finite proves node cannot reach target
+            forward = dist_from[t] - dist_from[i]
+            if forward > best:
+                best = forward
+            backward = dist_to[i] - dist_to[t]
+            if backward > best:
+                best = backward
+        return best
+
+    def memory_bytes(self):
+        """Bytes held by the stored landmark distance arrays"""
+        return sum(arr.itemsize * len(arr) for arr in self.dist_from + self.dist_to)
+
+def alt_search(graph, start, end, landmarks):
+    """A* with a LandmarkIndex heuristic; returns (distance, path)"""
+    return astar(graph, start, end, landmarks.heuristic)
+
+class ReachabilityIndex:
+    """
+    Connectivity index that answers "can start reach end?" without a search.
+    Strongly connected components (iterative Tarjan) are collapsed into the
+    condensation DAG. Tarjan numbers components in reverse topological order, so
+    component(start) < component(end) already proves end is unreachable. Every
+    component also gets num_intervals GRAIL interval labels [low, rank] from
+    randomised post-order traversals of the DAG; when a reaches b, b's intervals
+    nest inside a's. Same-component queries are answered in O(1), most
+    unreachable ones in O(num_intervals) (may_reach), and reachable() settles the
+    rest with a DFS of the DAG pruned by the same tests. The index rebuilds
+    itself when the graph's version changes.
+    """
+
+    def __init__(self, graph, num_intervals=2, seed=0):
+        self.graph = graph
+        self.num_intervals = num_intervals
+        self.seed = seed
+        self.rebuilds = 0
+        self.fallback_searches = 0
+        self._build()
+
+    def _build(self):
+        start_time = time.perf_counter()
+        graph = self.graph
+        self.version = getattr(graph, 'version', 0)
+        if isinstance(graph, CSRGraph):
+            self.index = graph.index
+            offsets, targets = graph.offsets, graph.targets
+            adjacency = [targets[offsets[u]:offsets[u + 1]] for u in range(graph.num_nodes)]
+        else:
+            nodes = list(graph)
+            self.index = {node: i for i, node in enumerate(nodes)}
+            for neighbors in graph.values():
+                for v in neighbors:
+                    if v not in self.index:
+                        self.index[v] = len(nodes)
+                        nodes.append(v)
+            adjacency = [[self.index[v] for v in graph.get(u, ())] for u in nodes]
+
+        self.component = self._strong_components(adjacency)
+        num_components = self.num_components = max(self.component, default=-1) + 1
+        dag = [set() for _ in range(num_components)]
+        for u, successors in enumerate(adjacency):
+            cu = self.component[u]
+            for v in successors:
+                cv = self.component[v]
+                if cv != cu:
+                    dag[cu].add(cv)
+        self.dag = [tuple(children) for children in dag]
+
+        rng = random.Random(self.seed)
+        self.intervals = [self._interval_labels(rng) for _ in range(self.num_intervals)]
+        self.build_seconds = time.perf_counter() - start_time
+
+    @staticmethod
+    def _strong_components(adjacency):
+        # Iterative Tarjan; components are numbered sinks first (reverse topological order)
+        n = len(adjacency)
+        order = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        component = array('q', [-1]) * n
+        stack = []
+        counter = num_components = 0
+        for root in range(n):
+            if order[root] >= 0:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(adjacency[root]))]
+            while work:
+                u, successors = work[-1]
+                for v in successors:
+                    if order[v] < 0:
+                        order[v] = low[v] = counter
+                        counter += 1
+                        stack.append(v)
+                        on_stack[v] = True
+                        work.append((v, iter(adjacency[v])))
+                        break
+                    if on_stack[v] and order[v] < low[u]:
+                        low[u] = order[v]
+                else:
+                    work.pop()
+                    if work and low[u] < low[work[-1][0]]:
+                        low[work[-1][0]] = low[u]
+                    if low[u] == order[u]:
+                        while True:
+                            w = stack.pop()
+                            on_stack[w] = False
+                            component[w] = num_components
+                            if w == u:
+                                break
+                        num_components += 1
+        return component
+
+    def _interval_labels(self, rng):
+        # One randomised post-order traversal of the DAG: (low, rank) arrays per component
+        dag = self.dag
+        rank = array('q', [-1]) * self.num_components
+        low = array('q', [0]) * self.num_components
+        visited = [False] * self.num_components
+        roots = list(range(self.num_components))
+        rng.shuffle(roots)
+        next_rank = 0
+        for root in roots:
+            if visited[root]:
+                continue
+            visited[root] = True
+            work = [(root, iter(rng.sample(dag[root], len(dag[root]))))]
+            while work:
+                c, children = work[-1]
+                for child in children:
+                    if not visited[child]:
+                        visited[child] = True
+                        work.append((child, iter(rng.sample(dag[child], len(dag[child])))))
+                        break
+                else:
+                    # Every child is finished (the DAG has no cycles), so its low is final
+                    work.pop()
+                    smallest = next_rank
+                    for child in dag[c]:
+                        if low[child] < smallest:
+                            smallest = low[child]
+                    rank[c] = next_rank
+                    low[c] = smallest
+                    next_rank += 1
+        return low, rank
+
+    def _may_reach(self, a, b):
+        # Necessary conditions for component a to reach component b (a != b)
+        if a < b:
+            return False
+        for low, rank in self.intervals:
+            if low[b] < low[a] or rank[b] > rank[a]:
+                return False
+        return True
+
+    def _check_version(self):
+        if getattr(self.graph, 'version', 0) != self.version:
+            self.rebuilds += 1
+            self._build()
+
+    def same_component(self, start, end):
+        """True when start and end can reach each other"""
+        self._check_version()
+        return self.component[self.index[start]] == self.component[self.index[end]]
+
+    def may_reach(self, start, end):
+        """
+        O(num_intervals) filter: False proves end is unreachable from start, True
+        means it may be reachable (use reachable() for an exact answer)
+        """
+        self._check_version()
+        a, b = self.component[self.index[start]], self.component[self.index[end]]
+        return a == b or self._may_reach(a, b)
+
+    def reachable(self, start, end):
+        """True when a path from start to end exists (labels, like shortest_path)"""
+        self._check_version()
+        a, b = self.component[self.index[start]], self.component[self.index[end]]
+        if a == b:
+            return True
+        if not self._may_reach(a, b):
+            return False
+        # Labels cannot rule it out: DFS of the condensation DAG, pruned by the same tests
+        self.fallback_searches += 1
+        stack = [a]
+        seen = {a}
+        while stack:
+            for child in self.dag[stack.pop()]:
+                if child == b:
+                    return True
+                if child not in seen and self._may_reach(child, b):
+                    seen.add(child)
+                    stack.append(child)
+        return False
+
+    def memory_bytes(self):
+        """Bytes held by the component IDs, condensation edges and interval labels"""
+        total = self.component.itemsize * len(self.component) + sys.getsizeof(self.dag)
+        total += sum(sys.getsizeof(children) for children in self.dag)
+        for low, rank in self.intervals:
+            total += low.itemsize * len(low) + rank.itemsize * len(rank)
+        return total
+
 def reconstruct_path(prev, start, end):
     path = []
     node = end
@@ -157,9 +1706,114 @@ def reconstruct_path(prev, start, end):
     path.reverse()
     return path if path[0] == start else []
 
-def load_graph_from_csv(filename):
-    """Load graph data from CSV file"""
-    graph = {}
+def reconstruct_path_ids(prev, start, end):
+    """reconstruct_path for the ID lists returned by dijkstra_csr"""
+    path = []
+    node = end
+    while node >= 0:
+        path.append(node)
+        node = prev[node]
+    path.reverse()
+    return path if path[0] == start else []
+
+class ShortestPathCache:
+    """
+    LRU cache of single-source shortest path trees (dist, prev) per source.
+    Bounded by max_entries and/or max_bytes, where a tree's size is its dist/prev
+    containers plus the distance and predecessor-ID objects they hold (labels are
+    shared with the graph). Cleared automatically whenever the graph's version
+    counter changes.
+    """
+
+    def __init__(self, graph, max_entries=32, max_bytes=None, heap='auto', arity=2):
+        self.graph = graph
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.heap = heap
+        self.arity = arity
+        self.trees = OrderedDict()   # source -> (dist, prev, size in bytes)
+        self.total_bytes = 0
+        self.version = getattr(graph, 'version', 0)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self):
+        version = getattr(self.graph, 'version', 0)
+        if version != self.version:
+            if self.trees:
+                self.invalidations += 1
+            self.clear()
+            self.version = version
+
+    def clear(self):
+        self.trees.clear()
+        self.total_bytes = 0
+
+    def tree(self, source):
+        """(dist, prev) from source, computed with dijkstra on a miss"""
+        self._check_version()
+        entry = self.trees.get(source)
+        if entry is not None:
+            self.hits += 1
+            self.trees.move_to_end(source)
+            return entry[0], entry[1]
+
+        self.misses += 1
+        dist, prev = dijkstra(self.graph, source, self.heap, self.arity)
+        size = self._tree_bytes(dist, prev)
+        self.trees[source] = (dist, prev, size)
+        self.total_bytes += size
+        self._evict()
+        return dist, prev
+
+    def path(self, source, target):
+        """(distance, path) answered from the cached tree of source"""
+        dist, prev = self.tree(source)
+        if dist[target] == float('inf'):
+            return float('inf'), []
+        return dist[target], reconstruct_path(prev, source, target)
+
+    def _evict(self):
+        # Drop least recently used trees until both bounds hold (always keep the newest)
+        while len(self.trees) > 1 and (
+                (self.max_entries is not None and len(self.trees) > self.max_entries) or
+                (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            _, (_, _, size) = self.trees.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    @staticmethod
+    def _tree_bytes(dist, prev):
+        # Containers plus the number objects they hold (NodeMap views by their backing lists);
+        # node labels are shared with the graph, so they are not charged to the tree
+        total = 0
+        for values in (dist, prev):
+            container = values.values if isinstance(values, NodeMap) else values
+            total += sys.getsizeof(container)
+            items = container.values() if isinstance(container, dict) else container
+            total += sum(sys.getsizeof(value) for value in items if isinstance(value, (int, float)))
+        return total
+
+    def get_statistics(self):
+        return {
+            "entries": len(self.trees),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+def load_graph_from_csv(filename, compact=False):
+    """
+    Load graph data from CSV file as a VersionedGraph (compact=True returns a CSRGraph).
+    A repeated source/destination pair keeps the weight of its last row.
+    """
+    if compact:
+        return _load_csr_from_csv(filename)
+    graph = VersionedGraph()
     with open(filename, 'r', encoding='utf-8') as file:
         reader = csv.DictReader(file)
         for row in reader:
@@ -174,9 +1828,59 @@ def load_graph_from_csv(filename):
             # Ensure destination node is also in graph (even if no outgoing edges)
             if destination not in graph:
                 graph[destination] = {}
-    
     return graph
 
+def _load_csr_from_csv(filename):
+    # Rows go straight into typed ID arrays; no dict-of-dicts is built on the way
+    labels, index = [], {}
+    sources, dests, weights = array('q'), array('q'), array('q')
+    with open(filename, 'r', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            for label in (row['source'], row['destination']):
+                if label not in index:
+                    index[label] = len(labels)
+                    labels.append(label)
+            sources.append(index[row['source']])
+            dests.append(index[row['destination']])
+            weights.append(int(row['weight']))
+    return _last_edge_wins(CSRGraph.from_id_edges(labels, sources, dests, weights))
+
+def _last_edge_wins(graph):
+    # Collapse parallel edges like the dict loader: first position, last weight.
+    # seen_from[v] is the last source with an edge to v, so no per-node sets are built
+    n, offsets, targets, weights = graph.num_nodes, graph.offsets, graph.targets, graph.weights
+    seen_from = array('q', [-1]) * n
+    duplicates = False
+    for u in range(n):
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            if seen_from[v] == u:
+                duplicates = True
+                break
+            seen_from[v] = u
+        if duplicates:
+            break
+    if not duplicates:
+        return graph
+
+    seen_from = array('q', [-1]) * n
+    slot = array('q', [0]) * n   # Position of u's edge to v in the new arrays
+    new_offsets = array('q', [0])
+    new_targets = array('q')
+    new_weights = array(graph.weight_typecode)
+    for u in range(n):
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            if seen_from[v] == u:
+                new_weights[slot[v]] = weights[e]
+            else:
+                seen_from[v] = u
+                slot[v] = len(new_targets)
+                new_targets.append(v)
+                new_weights.append(weights[e])
+        new_offsets.append(len(new_targets))
+    return CSRGraph(graph.labels, new_offsets, new_targets, new_weights)
+
 def get_all_nodes(graph):
     """Get all nodes in the graph"""
     nodes = set()
@@ -207,20 +1911,6 @@ def get_user_input(graph):
     
     return start, end
 
-def print_step_diagram(step, dist, visited, current_node, updated_neighbors, heap, graph, prev=None):
-    """Print graphical display of current step"""
-    nodes = get_all_nodes(graph)
-    
-    # Display Dijkstra table
-    print_dijkstra_table(nodes, dist, visited, current_node, prev)
-    
-    # If neighbors updated, simply display
-    if updated_neighbors:
-        print(f"\nUpdated:")
-        for node, old_dist, new_dist in updated_neighbors:
-            old_str = "∞" if old_dist == float('inf') else str(old_dist)
-            print(f"  {node}: {old_str} → {new_dist}")
-
 def print_cli_graph(visited, current_node, prev):
     """Draw CLI graph showing current connection status"""
     print(f"\nGraph Connections:")
@@ -251,11 +1941,11 @@ def print_dijkstra_table(nodes, dist, visited, current_node, prev):
     print("├" + "─" * 8 + "┼" + "─" * 8 + "┼" + "─" * 12 + "┼" + "─" * 8 + "┤")
     
     for node in sorted(nodes):
-        # Determine status
-        if node in visited:
-            status = "✓"
-        elif node == current_node:
+        # Determine status (the current node is already in visited once it is settled)
+        if node == current_node:
             status = "→"
+        elif node in visited:
+            status = "✓"
         else:
             status = ""
         
@@ -416,9 +2106,12 @@ def main():
     print("This program demonstrates the Dijkstra shortest path algorithm")
     print("with step-by-step visualization and comprehensive graph analysis.")
     
-    # Load graph data from CSV file
+    # Load graph data (memory-mapped binary cache when the CSV is unchanged)
     try:
-        graph = load_graph_from_csv(DATA_PATH)
+        graph = load_graph_cached(DATA_PATH)
+        reverse_graph = build_reverse_graph(graph)
+        path_cache = ShortestPathCache(graph)
+        reachability = ReachabilityIndex(graph)
         print(f"✅ Successfully loaded graph from {DATA_PATH}")
     except FileNotFoundError:
         print(f"❌ Error: Could not find graph data file at {DATA_PATH}")
@@ -482,6 +2175,11 @@ def main():
                     ask_continue_choice()
                     continue
                 
+                if not reachability.may_reach(start, end):
+                    print(f"\n❌ No reachable path from {start} to {end} (connectivity index, no search needed)")
+                    ask_continue_choice(["Find another path"])
+                    continue
+
                 print(f"\n🚀 Starting Dijkstra algorithm from {start} to {end}...")
                 input("Press Enter to begin step-by-step execution...")
                 
@@ -516,17 +2214,17 @@ def main():
                     continue
                 
                 print(f"\n🔄 Computing shortest path from {start} to {end}...")
-                dist, prev = dijkstra(graph, start)
-                path = reconstruct_path(prev, start, end)
+                distance, path = shortest_path(graph, start, end, reverse_graph=reverse_graph,
+                                               reachability=reachability)
                 
                 print(f"\n🎯 RESULTS:")
-                if dist[end] == float('inf'):
+                if distance == float('inf'):
                     print(f"❌ No reachable path from {start} to {end}")
                 else:
-                    print(f"✅ Shortest distance: {dist[end]}")
+                    print(f"✅ Shortest distance: {distance}")
                     if path:
                         print(f"🛣️  Path: {' → '.join(path)}")
-                        print_path_visualization(path, dist[end])
+                        print_path_visualization(path, distance)
                 
                 choice_result = ask_continue_choice(["Find another path"])
                 if choice_result == "option_1":
@@ -544,7 +2242,7 @@ def main():
                     print(f"❌ Node '{start}' does not exist. Please choose from: {', '.join(nodes)}")
                 
                 print(f"\n🔄 Computing all shortest paths from {start}...")
-                dist, prev = dijkstra(graph, start)
+                dist, prev = path_cache.tree(start)
                 
                 print(f"\n📊 ALL DISTANCES FROM {start}:")
                 print("=" * 40)
@@ -678,7 +2376,10 @@ def main():
                 
                 try:
                     # Reload the graph
-                    graph = load_graph_from_csv(DATA_PATH)
+                    graph = load_graph_cached(DATA_PATH)
+                    reverse_graph = build_reverse_graph(graph)
+                    path_cache = ShortestPathCache(graph)
+                    reachability = ReachabilityIndex(graph)
                     nodes = get_all_nodes(graph)
                     print(f"\n✅ Graph reloaded successfully!")
                     print(f"📊 Loaded {len(nodes)} nodes with {sum(len(graph[node]) for node in graph)} edges")
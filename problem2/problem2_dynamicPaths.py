@@ -0,0 +1,175 @@
+'''
+CSC2103 Data Structures and Algorithms
+Problem 2: Dijkstra's Algorithm - Dynamic Shortest Paths
+
+Keeps a single-source shortest path result (dist/prev) up to date while edge
+weights change in small batches, e.g. traffic updates. Instead of rerunning
+dijkstra from scratch, each batch only repairs the affected region, in the style
+of Ramalingam-Reps:
+
+1. Edges that got worse (higher weight or deleted) invalidate the part of the
+   shortest path tree that hangs below them. Those nodes are reset and seeded
+   with their best distance through unaffected in-neighbours.
+2. Edges that got better (lower weight or inserted) seed their head node when
+   they offer a shorter distance.
+3. A Dijkstra pass from the seeded nodes propagates the new distances and stops
+   as soon as no distance improves any more.
+
+Run from the problem2 directory:  python problem2_dynamicPaths.py
+'''
+
+from problem2_dijkstra import DATA_PATH, MinHeap, VersionedGraph, dijkstra, load_graph_from_csv, reconstruct_path
+
+class DynamicShortestPaths:
+    """
+    Single-source shortest paths from source over a mutable dict-of-dicts graph.
+    Edge changes go through apply_updates(), which edits the graph (bumping the
+    version of a VersionedGraph) and repairs dist/prev incrementally.
+    """
+
+    def __init__(self, graph, source):
+        self.graph = graph
+        self.source = source
+        self.dist, self.prev = dijkstra(graph, source)
+
+        # Reverse adjacency and shortest path tree children, kept in sync with every update
+        self.reverse = {node: {} for node in graph}
+        for u in graph:
+            for v, weight in graph[u].items():
+                self.reverse.setdefault(v, {})[u] = weight
+        self.children = {node: set() for node in graph}
+        for node, parent in self.prev.items():
+            if parent is not None:
+                self.children[parent].add(node)
+
+    def _add_node(self, node):
+        if node not in self.dist:
+            self.dist[node] = float('inf')
+            self.prev[node] = None
+            self.reverse.setdefault(node, {})
+            self.children[node] = set()
+
+    def _set_parent(self, node, parent):
+        old = self.prev[node]
+        if old is not None:
+            self.children[old].discard(node)
+        self.prev[node] = parent
+        if parent is not None:
+            self.children[parent].add(node)
+
+    def _set_edge(self, source, destination, weight):
+        # Apply one edge change to the graph and the reverse index
+        if weight is None:
+            if isinstance(self.graph, VersionedGraph):
+                self.graph.remove_edge(source, destination)
+            else:
+                del self.graph[source][destination]
+            del self.reverse[destination][source]
+        else:
+            if isinstance(self.graph, VersionedGraph):
+                self.graph.add_edge(source, destination, weight)
+            else:
+                self.graph.setdefault(source, {})[destination] = weight
+                self.graph.setdefault(destination, {})
+            self.reverse[destination][source] = weight
+
+    def apply_updates(self, updates):
+        """
+        Apply a batch of (source, destination, weight) edge changes and repair dist/prev.
+        weight=None deletes the edge; any other weight inserts it or changes its weight.
+        Returns the number of nodes whose distance changed.
+        """
+        old_dist = {}
+        worse_heads = []
+        better_edges = []
+
+        for source, destination, weight in updates:
+            self._add_node(source)
+            self._add_node(destination)
+            old_weight = self.graph.get(source, {}).get(destination)
+            if weight is None and old_weight is None:
+                continue
+            self._set_edge(source, destination, weight)
+            if weight is None or (old_weight is not None and weight > old_weight):
+                if self.prev[destination] == source:
+                    worse_heads.append(destination)
+            else:
+                better_edges.append((source, destination))
+
+        heap = MinHeap()
+
+        # Phase 1: reset the tree below every worsened tree edge
+        affected = set()
+        stack = list(worse_heads)
+        while stack:
+            node = stack.pop()
+            if node in affected:
+                continue
+            affected.add(node)
+            stack.extend(self.children[node])
+        for node in affected:
+            old_dist[node] = self.dist[node]
+            self.dist[node] = float('inf')
+            self._set_parent(node, None)
+        for node in affected:
+            # Best distance through in-neighbours that kept their distance
+            for parent, weight in self.reverse[node].items():
+                if parent not in affected and self.dist[parent] + weight < self.dist[node]:
+                    self.dist[node] = self.dist[parent] + weight
+                    self._set_parent(node, parent)
+            if self.dist[node] < float('inf'):
+                heap.push((self.dist[node], node))
+
+        # Phase 2: seed improvements from cheaper or new edges
+        for source, destination in better_edges:
+            # Use the final weight, the edge may have changed again later in the batch
+            weight = self.graph[source].get(destination)
+            if weight is None:
+                continue
+            alt = self.dist[source] + weight
+            if alt < self.dist[destination]:
+                old_dist.setdefault(destination, self.dist[destination])
+                self.dist[destination] = alt
+                self._set_parent(destination, source)
+                heap.push((alt, destination))
+
+        # Phase 3: Dijkstra propagation restricted to nodes whose distance improves
+        while len(heap):
+            current_dist, u = heap.pop()
+            if current_dist > self.dist[u]:
+                continue
+            for v, weight in self.graph[u].items():
+                alt = current_dist + weight
+                if alt < self.dist[v]:
+                    old_dist.setdefault(v, self.dist[v])
+                    self.dist[v] = alt
+                    self._set_parent(v, u)
+                    heap.push((alt, v))
+
+        return sum(1 for node, before in old_dist.items() if self.dist[node] != before)
+
+    def path(self, target):
+        """(distance, path) from the source to target using the maintained tree"""
+        if self.dist.get(target, float('inf')) == float('inf'):
+            return float('inf'), []
+        return self.dist[target], reconstruct_path(self.prev, self.source, target)
+
+def main():
+    print("Dynamic Shortest Paths - CSC2103 Data Structures Assignment")
+    print("=" * 60)
+    graph = load_graph_from_csv(DATA_PATH)
+    paths = DynamicShortestPaths(graph, 'A')
+    print(f"Initial A → E: {paths.path('E')}")
+
+    batches = [
+        ("Traffic on C → E (weight 2 → 9)", [('C', 'E', 9)]),
+        ("Road A → C closed", [('A', 'C', None)]),
+        ("New road A → D (weight 4)", [('A', 'D', 4)]),
+    ]
+    for title, updates in batches:
+        changed = paths.apply_updates(updates)
+        distance, path = paths.path('E')
+        print(f"{title}: {changed} distance(s) changed, A → E = {distance} via {' → '.join(path)}")
+
+if __name__ == "__main__":
+    main()
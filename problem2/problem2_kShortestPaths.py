@@ -0,0 +1,129 @@
+'''
+CSC2103 Data Structures and Algorithms
+Problem 2: Dijkstra's Algorithm - K Shortest Paths
+
+Alternative routes with Yen's algorithm: the k shortest loopless paths from a
+start node to an end node, in order of increasing distance. Each new path is
+found by deviating ("spurring") from an earlier path at one of its nodes while
+the shared root prefix and the edges already used after it are blocked.
+
+Work is reused in three ways:
+- One reverse Dijkstra from the end node gives every node's distance and next
+  hop towards the end. A spur whose tree path avoids the blocked nodes and edges
+  is answered by walking the tree instead of searching.
+- Other spurs run A* with those distances as an exact lower bound, so the
+  search heads almost straight for the end.
+- Following Lawler, a path only spurs from its own deviation node onwards, since
+  earlier spur nodes have the same roots and blocks as in its parent path.
+
+Run from the problem2 directory:  python problem2_kShortestPaths.py
+'''
+
+from problem2_dijkstra import (CSRGraph, DATA_PATH, MinHeap, _astar_search, build_reverse_graph, dijkstra,
+                               dijkstra_csr, load_graph_from_csv)
+
+def k_shortest_paths(graph, start, end, k, reverse_graph=None):
+    """
+    Yen's algorithm: up to k loopless (distance, path) pairs from start to end,
+    shortest first. Works on a dict-of-dicts graph or a CSRGraph (labels in and out).
+    """
+    if k <= 0:
+        return []
+    if reverse_graph is None:
+        reverse_graph = build_reverse_graph(graph)
+
+    if isinstance(graph, CSRGraph):
+        to_end, next_hop = dijkstra_csr(reverse_graph, graph.index[end])
+        next_hop = [node if node >= 0 else None for node in next_hop]
+        paths = _yen(graph.neighbors, graph.index[start], graph.index[end], k, to_end, next_hop)
+        return [(distance, graph.label_path(path)) for distance, path in paths]
+
+    to_end, next_hop = dijkstra(reverse_graph, end)
+    return _yen(lambda u: graph[u].items(), start, end, k, to_end, next_hop)
+
+def _yen(edges, start, end, k, to_end, next_hop):
+    # to_end/next_hop: distance to end and next node on a shortest path to end, for every node
+    if to_end[start] == float('inf'):
+        return []
+
+    def edge_weight(u, v):
+        return min(weight for neighbor, weight in edges(u) if neighbor == v)
+
+    def tree_path(node):
+        path = [node]
+        while node != end:
+            node = next_hop[node]
+            path.append(node)
+        return path
+
+    found = [(to_end[start], tree_path(start))]
+    deviations = [0]     # Index of the node where each found path left its parent
+    used_next = {}       # Root prefix tuple -> next nodes taken by found paths after it
+    candidates = MinHeap()
+    seen = {tuple(found[0][1])}
+
+    while len(found) < k:
+        distance, path = found[-1]
+        for i in range(len(path) - 1):
+            used_next.setdefault(tuple(path[:i + 1]), set()).add(path[i + 1])
+
+        root_cost = sum(edge_weight(path[j], path[j + 1]) for j in range(deviations[-1]))
+        for i in range(deviations[-1], len(path) - 1):
+            spur = path[i]
+            root = path[:i + 1]
+            blocked_nodes = set(root[:-1])
+            blocked_next = used_next[tuple(root)]
+
+            spur_path = _tree_spur(spur, end, next_hop, blocked_nodes, blocked_next)
+            if spur_path is not None:
+                spur_cost = to_end[spur]
+            else:
+                def spur_edges(u, spur=spur, blocked_nodes=blocked_nodes, blocked_next=blocked_next):
+                    for v, weight in edges(u):
+                        if v in blocked_nodes or (u == spur and v in blocked_next):
+                            continue
+                        yield v, weight
+                spur_cost, spur_path = _astar_search(spur_edges, spur, end, lambda node, target: to_end[node])
+
+            if spur_path:
+                candidate = root[:-1] + spur_path
+                key = tuple(candidate)
+                if key not in seen:
+                    seen.add(key)
+                    candidates.push((root_cost + spur_cost, candidate, i))
+            root_cost += edge_weight(path[i], path[i + 1])
+
+        if not len(candidates):
+            break
+        distance, path, deviation = candidates.pop()
+        found.append((distance, path))
+        deviations.append(deviation)
+    return found
+
+def _tree_spur(spur, end, next_hop, blocked_nodes, blocked_next):
+    # The unrestricted shortest path spur .. end when it avoids every block, else None
+    if spur == end:
+        return [spur]
+    first = next_hop[spur]
+    if first is None or first in blocked_next:
+        return None
+    path = [spur]
+    node = spur
+    while node != end:
+        node = next_hop[node]
+        if node in blocked_nodes:
+            return None
+        path.append(node)
+    return path
+
+def main():
+    print("K Shortest Paths - CSC2103 Data Structures Assignment")
+    print("=" * 60)
+    graph = load_graph_from_csv(DATA_PATH)
+    for start, end in (('A', 'E'), ('B', 'E')):
+        print(f"\nUp to 5 shortest paths from {start} to {end}:")
+        for rank, (distance, path) in enumerate(k_shortest_paths(graph, start, end, 5), 1):
+            print(f"  {rank}. {' → '.join(path)} (distance {distance})")
+
+if __name__ == "__main__":
+    main()
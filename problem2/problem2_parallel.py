@@ -0,0 +1,200 @@
+'''
+CSC2103 Data Structures and Algorithms
+Problem 2: Dijkstra's Algorithm - Parallel Shortest Paths
+
+Many-sources and all-pairs shortest path distances computed across a process pool.
+The graph is converted to a CSRGraph once and shared read-only with the workers
+by make_graph_pool, which the other process-pool modules reuse: under the fork
+start method workers inherit it from the parent, under other start methods they
+receive it once per worker through the pool initializer. Every task runs one single-source search
+and returns a packed row of distances, which the parent writes into a compact
+row-major distance matrix held in memory or in a memory-mapped file.
+
+Run from the problem2 directory:  python problem2_parallel.py
+'''
+
+import mmap
+import multiprocessing
+import os
+import struct
+import time
+from array import array
+
+from problem2_dijkstra import CSRGraph, DATA_PATH, dijkstra_csr, load_graph_from_csv
+
+MATRIX_MAGIC = b'CSC2103DM'
+
+# Graph and extra values shared with pool workers (set before forking or by _init_worker)
+_WORKER_STATE = {}
+
+def _init_worker(state):
+    # Pool initializer; state is None when the worker already inherited it through fork
+    if state is not None:
+        _WORKER_STATE.clear()
+        _WORKER_STATE.update(state)
+
+def worker_state():
+    """The graph and values passed to make_graph_pool, as seen by the current process"""
+    return _WORKER_STATE
+
+def release_worker_state():
+    """Drop the parent's reference to the shared graph once its pool is closed"""
+    _WORKER_STATE.clear()
+
+def graph_pool_initializer(graph, **shared):
+    """
+    (initializer, initargs) for a process pool whose workers read graph and shared
+    through worker_state(). When the platform's start method is already fork the
+    workers inherit them copy-on-write; otherwise (spawn, forkserver) they are
+    pickled once per worker. The start method itself is never overridden.
+    """
+    state = {'graph': graph, **shared}
+    if multiprocessing.get_start_method() == 'fork':
+        _init_worker(state)
+        return _init_worker, (None,)
+    return _init_worker, (state,)
+
+def make_graph_pool(graph, processes, **shared):
+    """multiprocessing.Pool over graph_pool_initializer(graph, **shared)"""
+    initializer, initargs = graph_pool_initializer(graph, **shared)
+    return multiprocessing.Pool(processes, initializer, initargs)
+
+def _solve_source(task):
+    # Worker task: one single-source search, returned as packed doubles for the target columns
+    row, source = task
+    dist, _ = dijkstra_csr(_WORKER_STATE['graph'], source)
+    targets = _WORKER_STATE['targets']
+    if targets is None:
+        values = array('d', dist)
+    else:
+        values = array('d', (dist[t] for t in targets))
+    return row, values.tobytes()
+
+class DistanceMatrix:
+    """
+    Row-major matrix of float64 distances (inf = unreachable).
+    data is an array('d') or a memoryview over a memory-mapped file.
+    """
+
+    def __init__(self, sources, targets, data, mapping=None, file=None):
+        self.sources = list(sources)
+        self.targets = list(targets)
+        self.source_index = {label: i for i, label in enumerate(self.sources)}
+        self.target_index = {label: i for i, label in enumerate(self.targets)}
+        self.data = data
+        self._mapping = mapping
+        self._file = file
+
+    def get(self, source, target):
+        """Distance from source to target (labels)"""
+        return self.data[self.source_index[source] * len(self.targets) + self.target_index[target]]
+
+    def row(self, source):
+        """Distances from source to every target, in target order"""
+        start = self.source_index[source] * len(self.targets)
+        return list(self.data[start:start + len(self.targets)])
+
+    def close(self):
+        """Release the memory map (if any)"""
+        if self._mapping is not None:
+            self.data.release()
+            self._mapping.close()
+            self._file.close()
+            self._mapping = None
+
+    @classmethod
+    def open(cls, filename):
+        """Memory-map a matrix written by many_sources_distances(output_path=...)"""
+        file = open(filename, 'r+b')
+        header_size = len(MATRIX_MAGIC) + 16
+        magic = file.read(len(MATRIX_MAGIC))
+        if magic != MATRIX_MAGIC:
+            file.close()
+            raise ValueError(f"{filename} is not a distance matrix file")
+        rows, cols = struct.unpack('<QQ', file.read(16))
+        mapping = mmap.mmap(file.fileno(), 0)
+        data_end = header_size + 8 * rows * cols
+        data = memoryview(mapping)[header_size:data_end].cast('d')
+        labels_blob = mapping[data_end:]
+        labels = labels_blob.decode('utf-8').split('\n')
+        return cls(labels[:rows], labels[rows:rows + cols], data, mapping, file)
+
+def _create_matrix_file(filename, sources, targets):
+    # Pre-size the output file and map it: header, rows*cols doubles, then newline-joined labels
+    rows, cols = len(sources), len(targets)
+    header = MATRIX_MAGIC + struct.pack('<QQ', rows, cols)
+    labels = '\n'.join(str(label) for label in list(sources) + list(targets)).encode('utf-8')
+    file = open(filename, 'w+b')
+    file.write(header)
+    file.truncate(len(header) + 8 * rows * cols)
+    file.seek(0, os.SEEK_END)
+    file.write(labels)
+    file.flush()
+    mapping = mmap.mmap(file.fileno(), 0)
+    data = memoryview(mapping)[len(header):len(header) + 8 * rows * cols].cast('d')
+    return DistanceMatrix(sources, targets, data, mapping, file)
+
+def many_sources_distances(graph, sources=None, targets=None, processes=None, output_path=None, chunksize=None):
+    """
+    Distance matrix from every source to every target (labels; None = all nodes).
+    processes=1 runs in the calling process; output_path writes a memory-mapped file.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    sources = list(graph.labels) if sources is None else list(sources)
+    targets_given = targets is not None
+    targets = list(graph.labels) if targets is None else list(targets)
+    source_ids = [graph.index[label] for label in sources]
+    target_ids = [graph.index[label] for label in targets] if targets_given else None
+
+    cols = len(targets)
+    if output_path is not None:
+        matrix = _create_matrix_file(output_path, sources, targets)
+    else:
+        matrix = DistanceMatrix(sources, targets, array('d', bytes(8 * len(sources) * cols)))
+
+    tasks = list(enumerate(source_ids))
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(tasks) <= 1:
+        _init_worker({'graph': graph, 'targets': target_ids})
+        results = map(_solve_source, tasks)
+        pool = None
+    else:
+        pool = make_graph_pool(graph, processes, targets=target_ids)
+        chunksize = chunksize or max(1, len(tasks) // (processes * 8))
+        results = pool.imap_unordered(_solve_source, tasks, chunksize)
+
+    try:
+        for row, packed in results:
+            values = array('d')
+            values.frombytes(packed)
+            start = row * cols
+            matrix.data[start:start + cols] = values
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        release_worker_state()
+    return matrix
+
+def all_pairs_distances(graph, processes=None, output_path=None):
+    """All-pairs distance matrix (every node as source and target)"""
+    return many_sources_distances(graph, processes=processes, output_path=output_path)
+
+def main():
+    print("Parallel Shortest Paths - CSC2103 Data Structures Assignment")
+    print("=" * 60)
+    graph = load_graph_from_csv(DATA_PATH)
+    start_time = time.perf_counter()
+    matrix = all_pairs_distances(graph)
+    elapsed = time.perf_counter() - start_time
+    print(f"All-pairs matrix for {len(matrix.sources)} nodes in {elapsed * 1000:.1f} ms "
+          f"using {os.cpu_count() or 1} process(es)\n")
+
+    print("From\\To " + "".join(f"{label:>6}" for label in matrix.targets))
+    for source in matrix.sources:
+        cells = ("∞" if d == float('inf') else f"{d:g}" for d in matrix.row(source))
+        print(f"{source:<8}" + "".join(f"{cell:>6}" for cell in cells))
+
+if __name__ == "__main__":
+    main()
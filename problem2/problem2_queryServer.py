@@ -0,0 +1,443 @@
+'''
+CSC2103 Data Structures and Algorithms
+Problem 2: Dijkstra's Algorithm - Shortest Path Query Server
+
+A long-running asyncio server that loads the graph once and answers concurrent
+shortest path queries over TCP or a Unix socket. The protocol is one JSON object
+per line in each direction:
+
+    -> {"id": 1, "op": "path", "start": "A", "end": "E"}
+    <- {"id": 1, "ok": true, "distance": 7, "path": ["A", "C", "E"]}
+
+Supported ops are "path", "distance", "nodes" and "stats". Path and distance
+queries are queued, grouped into batches and solved in a process pool, where
+queries in one batch that share a start node share a single search. A bounded
+queue provides backpressure: when it is full the server stops reading from the
+clients until workers catch up. Queries that the graph's connectivity index
+proves unreachable are answered at once without queueing. "stats" reports latency percentiles, batch sizes
+and the queue depth.
+
+The "bench" command is a load generator that keeps many queries in flight over
+several connections and reports throughput and client-side latency.
+
+Run from the problem2 directory:
+    python problem2_queryServer.py serve --tcp 127.0.0.1:8765
+    python problem2_queryServer.py bench --tcp 127.0.0.1:8765 --requests 5000
+'''
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from problem2_dijkstra import CSRGraph, DATA_PATH, ReachabilityIndex, SearchWorkspace, load_graph_cached
+from problem2_parallel import graph_pool_initializer, release_worker_state, worker_state
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+QUERY_OPS = ('path', 'distance')
+
+# Per-worker search arrays, created on the first batch and reused by every later one
+_WORKER_WORKSPACE = None
+
+def _solve_batch(queries, graph=None):
+    """
+    Worker task: answer (op, start, end) queries against the CSRGraph shared by
+    make_graph_pool (or the given graph when solving in a thread).
+    Queries with the same start share one search (stopping early when only a
+    single target is wanted). Returns one response dict per query, in order.
+    """
+    global _WORKER_WORKSPACE
+    if graph is None:
+        graph = worker_state()['graph']
+    if _WORKER_WORKSPACE is None or _WORKER_WORKSPACE.graph is not graph:
+        _WORKER_WORKSPACE = SearchWorkspace(graph)
+    workspace = _WORKER_WORKSPACE
+    results = [None] * len(queries)
+    by_source = {}
+    for i, (op, start, end) in enumerate(queries):
+        if start not in graph.index or end not in graph.index:
+            missing = start if start not in graph.index else end
+            results[i] = {'ok': False, 'error': f"unknown node {missing!r}"}
+        else:
+            by_source.setdefault(graph.index[start], []).append(i)
+
+    for source, members in by_source.items():
+        targets = {graph.index[queries[i][2]] for i in members}
+        target = next(iter(targets)) if len(targets) == 1 else -1
+        workspace.search(source, target)
+        for i in members:
+            op, _, end = queries[i]
+            t = graph.index[end]
+            distance = workspace.distance(t)
+            if distance == float('inf'):
+                results[i] = {'ok': True, 'distance': None, 'path': []} if op == 'path' else {'ok': True, 'distance': None}
+            elif op == 'path':
+                results[i] = {'ok': True, 'distance': distance, 'path': graph.label_path(workspace.path(t))}
+            else:
+                results[i] = {'ok': True, 'distance': distance}
+    return results
+
+class LatencyTracker:
+    """Latencies of the most recent requests plus running totals"""
+
+    def __init__(self, window=10000):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def summary(self):
+        """Milliseconds: mean over all requests, percentiles over the recent window"""
+        ordered = sorted(self.samples)
+
+        def percentile(fraction):
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'max_ms': self.max * 1000,
+        }
+
+class QueryServer:
+    """
+    Asyncio front end over a pool of search workers.
+    Requests wait in a bounded queue (max_pending); a dispatcher groups up to
+    batch_size of them, waiting at most batch_delay seconds for a batch to fill,
+    and keeps at most max_batches_in_flight batches running at once.
+    workers=0 solves batches in a single background thread instead of processes.
+    """
+
+    def __init__(self, graph, workers=None, batch_size=64, batch_delay=0.002, max_pending=1024,
+                 max_batches_in_flight=None):
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        self.graph = graph
+        # Unreachable queries are answered in the event loop without a trip to the workers
+        self.reachability = ReachabilityIndex(graph)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self.max_batches_in_flight = max_batches_in_flight or 2 * max(1, self.workers)
+        self.latency = LatencyTracker()
+        self.batches = 0
+        self.batched_queries = 0
+        self.rejected = 0
+        self.unreachable = 0
+        self.connections = 0
+        self.started = time.perf_counter()
+        self._queue = None
+        self._executor = None
+        self._server = None
+        self._dispatcher = None
+        self._clients = set()
+        self._solve = _solve_batch
+
+    def _create_executor(self):
+        if self.workers == 0:
+            self._solve = partial(_solve_batch, graph=self.graph)
+            return ThreadPoolExecutor(1)
+        initializer, initargs = graph_pool_initializer(self.graph)
+        return ProcessPoolExecutor(self.workers, initializer=initializer, initargs=initargs)
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """Start listening (Unix socket when unix_path is given, TCP otherwise)"""
+        self._queue = asyncio.Queue(self.max_pending)
+        self._executor = self._create_executor()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        if unix_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_client, unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server
+
+    async def close(self):
+        self._server.close()
+        # Connected clients keep their handlers alive, so stop them before waiting for the server
+        for task in list(self._clients):
+            task.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        await self._server.wait_closed()
+        self._dispatcher.cancel()
+        await asyncio.gather(self._dispatcher, return_exceptions=True)
+        self._executor.shutdown(cancel_futures=True)
+        if self.workers:
+            release_worker_state()
+
+    async def _handle_client(self, reader, writer):
+        self.connections += 1
+        client = asyncio.current_task()
+        self._clients.add(client)
+        write_lock = asyncio.Lock()
+        pending = set()
+
+        async def respond(message):
+            async with write_lock:
+                writer.write(json.dumps(message).encode('utf-8') + b'\n')
+                await writer.drain()
+
+        async def answer(request_id, future, received):
+            response = await future
+            self.latency.add(time.perf_counter() - received)
+            await respond({'id': request_id, **response})
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than the stream limit; the rest of the line cannot be framed reliably
+                    self.rejected += 1
+                    await respond({'id': None, 'ok': False, 'error': 'request line too long'})
+                    break
+                if not line:
+                    break
+                received = time.perf_counter()
+                try:
+                    request = json.loads(line)
+                    request_id = request.get('id')
+                    op = request.get('op', 'path')
+                except (ValueError, AttributeError):
+                    await respond({'id': None, 'ok': False, 'error': 'invalid JSON request'})
+                    continue
+
+                if op == 'stats':
+                    await respond({'id': request_id, 'ok': True, 'stats': self.get_statistics()})
+                elif op == 'nodes':
+                    try:
+                        limit = int(request.get('limit', len(self.graph.labels)))
+                    except (TypeError, ValueError):
+                        limit = -1
+                    if limit < 0:
+                        self.rejected += 1
+                        await respond({'id': request_id, 'ok': False, 'error': "limit must be a non-negative integer"})
+                        continue
+                    await respond({'id': request_id, 'ok': True, 'nodes': self.graph.labels[:limit]})
+                elif op in QUERY_OPS:
+                    start, end = request.get('start'), request.get('end')
+                    if not isinstance(start, str) or not isinstance(end, str):
+                        self.rejected += 1
+                        await respond({'id': request_id, 'ok': False, 'error': "start and end must be node labels"})
+                        continue
+                    index = self.graph.index
+                    if start in index and end in index and not self.reachability.may_reach(start, end):
+                        self.unreachable += 1
+                        response = {'ok': True, 'distance': None, 'path': []} if op == 'path' else {'ok': True, 'distance': None}
+                        self.latency.add(time.perf_counter() - received)
+                        await respond({'id': request_id, **response})
+                        continue
+                    future = asyncio.get_running_loop().create_future()
+                    # Blocks while the queue is full, so this client is not read any further
+                    await self._queue.put(((op, start, end), future))
+                    task = asyncio.create_task(answer(request_id, future, received))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                else:
+                    self.rejected += 1
+                    await respond({'id': request_id, 'ok': False, 'error': f"unknown op {op!r}"})
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # close() stops handlers; finishing normally keeps asyncio from logging the connection
+            pass
+        finally:
+            for task in pending:
+                task.cancel()
+            self.connections -= 1
+            self._clients.discard(client)
+            writer.close()
+
+    async def _dispatch(self):
+        # Form batches from the queue and hand them to the executor
+        loop = asyncio.get_running_loop()
+        in_flight = asyncio.Semaphore(self.max_batches_in_flight)
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await in_flight.acquire()
+            task = loop.create_task(self._run_batch(batch))
+            task.add_done_callback(lambda _: in_flight.release())
+
+    async def _run_batch(self, batch):
+        queries = [query for query, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self._executor, self._solve, queries)
+        except Exception as error:
+            results = [{'ok': False, 'error': f"search failed: {error}"}] * len(batch)
+        self.batches += 1
+        self.batched_queries += len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_statistics(self):
+        uptime = time.perf_counter() - self.started
+        return {
+            'uptime_s': uptime,
+            'workers': self.workers,
+            'connections': self.connections,
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'max_pending': self.max_pending,
+            'batches': self.batches,
+            'mean_batch_size': self.batched_queries / self.batches if self.batches else 0.0,
+            'rejected': self.rejected,
+            'unreachable_shortcuts': self.unreachable,
+            'queries_per_second': self.latency.count / uptime if uptime > 0 else 0.0,
+            'latency': self.latency.summary(),
+        }
+
+async def _open_connection(host, port, unix_path):
+    if unix_path is not None:
+        return await asyncio.open_unix_connection(unix_path)
+    return await asyncio.open_connection(host, port)
+
+async def run_load(host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None, num_requests=1000, connections=4,
+                   window=32, op='path', seed=0):
+    """
+    Load generator: spread num_requests random queries over several connections,
+    keeping up to window requests in flight on each. Returns a summary dict with
+    throughput, client-side latency and the server's own statistics.
+    """
+    reader, writer = await _open_connection(host, port, unix_path)
+    writer.write(b'{"id": 0, "op": "nodes"}\n')
+    await writer.drain()
+    nodes = json.loads(await reader.readline())['nodes']
+
+    rng = random.Random(seed)
+    latency = LatencyTracker(window=num_requests)
+    errors = 0
+
+    async def worker(count):
+        nonlocal errors
+        conn_reader, conn_writer = await _open_connection(host, port, unix_path)
+        slots = asyncio.Semaphore(window)
+        sent = {}
+
+        async def receive():
+            nonlocal errors
+            for _ in range(count):
+                response = json.loads(await conn_reader.readline())
+                latency.add(time.perf_counter() - sent.pop(response['id']))
+                if not response.get('ok'):
+                    errors += 1
+                slots.release()
+
+        receiver = asyncio.create_task(receive())
+        for request_id in range(1, count + 1):
+            await slots.acquire()
+            request = {'id': request_id, 'op': op, 'start': rng.choice(nodes), 'end': rng.choice(nodes)}
+            sent[request_id] = time.perf_counter()
+            conn_writer.write(json.dumps(request).encode('utf-8') + b'\n')
+            await conn_writer.drain()
+        await receiver
+        conn_writer.close()
+
+    start_time = time.perf_counter()
+    shares = [num_requests // connections + (1 if i < num_requests % connections else 0) for i in range(connections)]
+    await asyncio.gather(*(worker(count) for count in shares if count))
+    elapsed = time.perf_counter() - start_time
+
+    writer.write(b'{"id": 0, "op": "stats"}\n')
+    await writer.drain()
+    server_stats = json.loads(await reader.readline())['stats']
+    writer.close()
+    return {
+        'requests': num_requests,
+        'errors': errors,
+        'seconds': elapsed,
+        'requests_per_second': num_requests / elapsed if elapsed > 0 else float('inf'),
+        'latency': latency.summary(),
+        'server': server_stats,
+    }
+
+async def serve(graph, host, port, unix_path, **options):
+    server = QueryServer(graph, **options)
+    await server.start(host, port, unix_path)
+    where = unix_path if unix_path is not None else f"{host}:{port}"
+    print(f"Serving {server.graph.num_nodes} nodes / {server.graph.num_edges} edges on {where} "
+          f"with {server.workers} worker(s). Press Ctrl+C to stop.")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+def _parse_address(text):
+    host, _, port = text.rpartition(':')
+    return host or DEFAULT_HOST, int(port)
+
+def main():
+    parser = argparse.ArgumentParser(description="Shortest path query server")
+    commands = parser.add_subparsers(dest='command')
+    for name in ('serve', 'bench'):
+        command = commands.add_parser(name)
+        command.add_argument('--tcp', default=f"{DEFAULT_HOST}:{DEFAULT_PORT}", help="HOST:PORT to listen on / connect to")
+        command.add_argument('--unix', help="Unix socket path (instead of TCP)")
+    serve_parser = commands.choices['serve']
+    serve_parser.add_argument('--graph', default=DATA_PATH, help="edge list CSV to load")
+    serve_parser.add_argument('--workers', type=int, default=None, help="worker processes (0 = one thread)")
+    serve_parser.add_argument('--batch-size', type=int, default=64)
+    serve_parser.add_argument('--batch-delay-ms', type=float, default=2.0)
+    serve_parser.add_argument('--max-pending', type=int, default=1024)
+    bench_parser = commands.choices['bench']
+    bench_parser.add_argument('--requests', type=int, default=1000)
+    bench_parser.add_argument('--connections', type=int, default=4)
+    bench_parser.add_argument('--window', type=int, default=32, help="requests in flight per connection")
+    bench_parser.add_argument('--op', choices=QUERY_OPS, default='path')
+    args = parser.parse_args()
+
+    print("Shortest Path Query Server - CSC2103 Data Structures Assignment")
+    print("=" * 60)
+    if args.command in (None, 'serve'):
+        graph_file = getattr(args, 'graph', DATA_PATH)
+        host, port = _parse_address(getattr(args, 'tcp', f"{DEFAULT_HOST}:{DEFAULT_PORT}"))
+        options = {}
+        if args.command == 'serve':
+            options = {'workers': args.workers, 'batch_size': args.batch_size,
+                       'batch_delay': args.batch_delay_ms / 1000, 'max_pending': args.max_pending}
+        try:
+            asyncio.run(serve(load_graph_cached(graph_file), host, port, getattr(args, 'unix', None), **options))
+        except KeyboardInterrupt:
+            print("\n👋 Server stopped.")
+        return
+
+    host, port = _parse_address(args.tcp)
+    summary = asyncio.run(run_load(host, port, args.unix, args.requests, args.connections, args.window, args.op))
+    client = summary['latency']
+    print(f"{summary['requests']} requests in {summary['seconds']:.2f} s "
+          f"({summary['requests_per_second']:,.0f} req/s, {summary['errors']} error(s))")
+    print(f"Client latency: mean {client['mean_ms']:.2f} ms, p50 {client['p50_ms']:.2f} ms, "
+          f"p95 {client['p95_ms']:.2f} ms, p99 {client['p99_ms']:.2f} ms, max {client['max_ms']:.2f} ms")
+    server = summary['server']
+    print(f"Server: {server['batches']} batches (mean size {server['mean_batch_size']:.1f}), "
+          f"server-side p99 {server['latency']['p99_ms']:.2f} ms, queue depth {server['queue_depth']}")
+
+if __name__ == "__main__":
+    main()